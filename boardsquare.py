@@ -2,25 +2,13 @@
 
 import tkinter as tk
 import tkinter.ttk as ttk
-from functools import cached_property
-from typing import Literal, TypeAlias, Union
+from typing import Any, TypeAlias
 
 AnyWidget: TypeAlias = tk.Misc
 
 _NOT_CALCULATED = -1
 
-_Directions_Tuple = tuple[
-    Literal['nw'],
-    Literal['n'],
-    Literal['ne'],
-    Literal['w'],
-    Literal['e'],
-    Literal['sw'],
-    Literal['s'],
-    Literal['se'],
-]
-_Direction_Literal = Literal['nw', 'n', 'ne', 'w', 'e', 'sw', 's', 'se']
-_Neighbours_Dict = dict[_Direction_Literal, Union['BoardSquare', None]]
+_Neighbours_List = list['BoardSquare']
 
 
 class BoardSquare(ttk.Label):
@@ -32,10 +20,21 @@ class BoardSquare(ttk.Label):
         covered: Square is covered.
         flag_count: Number of flags in the square.
         enabled: Square is enabled.
-        neighbour: Neighbouring squares,
-            in each of the 8 cardinal and ordinal directions.
+        neighbour: Enabled neighbouring squares,
+            in any of the 8 cardinal and ordinal directions.
+        position: Row and column of the square in its grid.
     """
 
+    __slots__ = (
+        '_value',
+        '_mine_count',
+        '_covered',
+        '_flag_count',
+        '_enabled',
+        '_neighbours',
+        '_position',
+    )
+
     def __init__(
         self, parent: AnyWidget, photoimage: tk.PhotoImage, style: str
     ) -> None:
@@ -53,20 +52,14 @@ class BoardSquare(ttk.Label):
         self._covered: bool = True
         self._flag_count: int = 0
         self._enabled: bool = False
-        self._directions: _Directions_Tuple = (
-            tk.NW,
-            tk.N,
-            tk.NE,
-            tk.W,
-            tk.E,
-            tk.SW,
-            tk.S,
-            tk.SE,
-        )
-        self._neighbours: _Neighbours_Dict = dict.fromkeys(self._directions)
+        self._neighbours: _Neighbours_List = []
+        self._position: tuple[int, int] = (_NOT_CALCULATED, _NOT_CALCULATED)
+
+    def _set_image(self, photoimage: tk.PhotoImage) -> None:
+        self.configure(image=photoimage)
 
     image = property(
-        fset=lambda self, __new_image: self.config(image=__new_image),
+        fset=_set_image,
         doc="""Set the image of the square. Write-only.""",
     )
 
@@ -99,34 +92,41 @@ class BoardSquare(ttk.Label):
         return self._enabled
 
     @property
-    def directions(self) -> _Directions_Tuple:
-        """Get a tuple of valid neighbour directions."""
-        return self._directions
-
-    @property
-    def neighbours(self) -> _Neighbours_Dict:
-        """Get the neighbours of the square."""
+    def neighbours(self) -> _Neighbours_List:
+        """Get the enabled neighbours of the square."""
         return self._neighbours
 
-    @cached_property
+    @property
     def position(self) -> tuple[int, int]:
         """Get the position of the square in its grid
 
         Returns:
             A 2-tuple representing the (row, column) position of the square.
         """
-        gi = self.grid_info()
-        return gi['row'], gi['column']
+        return self._position
+
+    def grid(self, row: int, column: int, **kwargs: Any) -> None:
+        """Place the square in its parent's grid, remembering its position.
 
-    def add_mine(self) -> None:
-        """Add a mine to the square."""
-        self._mine_count += 1
+        Args:
+            row: Row of the grid to place the square in.
+            column: Column of the grid to place the square in.
+            **kwargs: Any other grid options.
+        """
+        super().grid(row=row, column=column, **kwargs)
+        self._position = (row, column)
+
+    def add_mine(self, count: int = 1) -> None:
+        """Add mines to the square.
+
+        Args:
+            count: Number of mines to add. Defaults to 1.
+        """
+        self._mine_count += count
 
     def calculate_value(self) -> None:
         """Calculate the square's number."""
-        self._value = sum(
-            sq.mine_count for sq in self._neighbours.values() if sq and sq.enabled
-        )
+        self._value = sum(sq.mine_count for sq in self._neighbours)
 
     def add_flag(self) -> None:
         """Add flag to the square."""
@@ -9,6 +9,39 @@ from tkinter.simpledialog import Dialog
 from typing import Literal, TypeAlias, TypedDict
 
 
+class ReusableDialogue(Dialog):
+    """Dialogue that is hidden when closed, so it can be shown again later."""
+
+    def wait_window(self, window: tk.Misc | None = None) -> None:
+        """Internal method."""
+        if window is not self:
+            super().wait_window(window)
+            return
+        self.closed = tk.BooleanVar(self)
+        self.wait_variable(self.closed)
+
+    def cancel(self, event: tk.Event | None = None) -> None:
+        """Internal method."""
+        if self.parent is not None:
+            self.parent.focus_set()
+        self.grab_release()
+        self.withdraw()
+        self.closed.set(True)
+
+    def refresh(self) -> None:
+        """Update the contents of the dialogue before it is shown again."""
+
+    def show(self) -> None:
+        """Show the dialogue again, and wait until it is closed."""
+        self.refresh()
+        self.deiconify()
+        self.lift()
+        self.initial_focus.focus_set()
+        self.wait_visibility()
+        self.grab_set()
+        self.wait_variable(self.closed)
+
+
 class AcknowledgementDialogue(Dialog):
     """Message dialogue with an okay button."""
 
@@ -118,6 +151,16 @@ class AcknowledgementWithLinkDialogue(Dialog):
         box.pack()
 
 
+class ReusableAcknowledgementDialogue(ReusableDialogue, AcknowledgementDialogue):
+    """Message dialogue with an okay button, hidden when closed."""
+
+
+class ReusableAcknowledgementWithLinkDialogue(
+    ReusableDialogue, AcknowledgementWithLinkDialogue
+):
+    """Message dialogue with a link and an okay button, hidden when closed."""
+
+
 class YesNoDialogue(Dialog):
     """Question Dialogue with Yes/No buttons."""
 
@@ -191,7 +234,7 @@ class YesNoDialogue(Dialog):
         super().cancel()
 
 
-class SettingsDialogue(Dialog):
+class SettingsDialogue(ReusableDialogue):
     """Extra game settings dialogue."""
 
     def __init__(
@@ -267,6 +310,11 @@ class SettingsDialogue(Dialog):
         self.bind('<Escape>', self.cancel)
         box.pack()
 
+    def refresh(self) -> None:
+        """Reset the sliders to the current values of their variables."""
+        for scale, var in self.local_mapping.items():
+            scale.set(var.get())
+
     def apply(self) -> None:
         """Apply settings from dialogue to passed in variables."""
         for scale, var in self.local_mapping.items():
@@ -733,10 +781,13 @@ class LeaderboardViewDialogue(Dialog):
         thumbnail = tk.PhotoImage(height=size, width=size)
         # Valid call but no function signature
         thumbnail.put('black', to=(0, 0, size, size))  # type: ignore
-        for x, bit_row in enumerate(board_bits):
-            for y, bit in enumerate(bit_row):
-                if int(bit):
-                    thumbnail.put('white', to=(y + padding_y, x + padding_x))
+        # Write the whole board in one call, as rows of pixel colours
+        pixel_colours = {'0': 'black', '1': 'white'}
+        board_pixels = tuple(
+            tuple(pixel_colours[bit] for bit in bit_row.ljust(max_dim_y, '0'))
+            for bit_row in board_bits
+        )
+        thumbnail.put(board_pixels, to=(padding_y, padding_x))  # type: ignore
         self.images.add(thumbnail)
         return thumbnail
 
@@ -7,28 +7,39 @@ Play the game by executing the file with Python >= 3.11 as a program, and have f
 
 import tkinter as tk
 import tkinter.ttk as ttk
+from array import array
+from collections import deque
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from enum import StrEnum, auto
-from functools import cached_property
-from itertools import chain, groupby
+from functools import partial
+from itertools import chain, repeat
 from math import ceil
 from pathlib import Path, PurePath
 from random import sample
-from time import sleep
+from time import monotonic
 from tkinter import filedialog
-from typing import Final
+from typing import Any, Final
 
 from boardsquare import BoardSquare
 from dialogues import (
     AcknowledgementDialogue,
-    AcknowledgementWithLinkDialogue,
     LeaderboardEntryDialogue,
     LeaderboardViewDialogue,
+    ReusableAcknowledgementDialogue,
+    ReusableAcknowledgementWithLinkDialogue,
+    ReusableDialogue,
     SettingsDialogue,
     YesNoDialogue,
 )
 from imagehandler import ImageHandler
 from releasemanager import ReleaseManager
 
+_TUTORIAL_PAGE: Final = (
+    Path(__file__).resolve().parent.joinpath('tutorial.html').as_uri()
+)
+_SAVE_LOAD_DIR: Final = str(Path.home())
+
 
 # Potential rework of dark mode square graphics
 class FreeFormMinesweeper:
@@ -51,7 +62,6 @@ class FreeFormMinesweeper:
     def __init__(self) -> None:
         """Initialize a game of FreeForm Minesweeper."""
         # Constants
-        self.MAINLOOP_TIME: Final = 0.01
         self.UI_PADDING: Final = 4
         self.LIGHT_BACKGROUND_COLOUR: Final = '#c0c0c0'
         self.DARK_BACKGROUND_COLOUR: Final = '#3f3f3f'
@@ -64,17 +74,58 @@ class FreeFormMinesweeper:
             ('FreeForm Minesweeper Board', f'*{self.FILE_EXTENSION}'),
         )
         Path('README.txt').write_text(Path('README.md').read_text())
-        self.TUTORIAL_PAGE: Final = Path('tutorial.html').absolute().as_uri()
+        self.TUTORIAL_PAGE: Final = _TUTORIAL_PAGE
         self.GITHUB_PAGE: Final = 'https://github.com/KittyKittyKitKat/'
-        self.SAVE_LOAD_DIR: Final = str(Path.home())
+        self.SAVE_LOAD_DIR: Final = _SAVE_LOAD_DIR
         self.SMALL_SCALE: Final = 'small'
         self.LARGE_SCALE: Final = 'large'
+        self.UI_THRESHOLDS: Final = {
+            (self.LARGE_SCALE, self.LARGE_SCALE): (22, 17, 13, 9),
+            (self.LARGE_SCALE, self.SMALL_SCALE): (14, 11, 8, 5),
+            (self.SMALL_SCALE, self.LARGE_SCALE): (43, 34, 26, 17),
+            (self.SMALL_SCALE, self.SMALL_SCALE): (27, 21, 16, 9),
+        }
         self.SMALL_FONT: Final = ('Courier', 8, 'bold')
         self.LARGE_FONT: Final = ('Courier', 10, 'bold')
         self.DIFF_EASY: Final = 0.13
         self.DIFF_MEDIUM: Final = 0.16
         self.DIFF_HARD: Final = 0.207
         self.DIFF_EXPERT: Final = 0.25
+        self.LIGHT_THEME: Final = ImageHandler.ImageTheme.LIGHT
+        self.DARK_THEME: Final = ImageHandler.ImageTheme.DARK
+        self.LIGHT_THEME_KEY: Final = self.LIGHT_THEME.value
+        self.DARK_THEME_KEY: Final = self.DARK_THEME.value
+        self.BOARD_SQUARE_TAG: Final = 'FFMSBoardSquare'
+        self.NEIGHBOUR_OFFSETS: Final = tuple(
+            (i, j) for i in (-1, 0, 1) for j in (-1, 0, 1) if (i, j) != (0, 0)
+        )
+        self.HISTORY_LENGTH: Final = 512
+        self.MAX_SQUARE_MINES: Final = 5
+        self.MAX_SQUARE_VALUE: Final = 8 * self.MAX_SQUARE_MINES
+        self.MINE_COUNTS: Final = range(1, self.MAX_SQUARE_MINES + 1)
+        self.UNCOVER_MODES: Final = frozenset(
+            (self.ClickMode.UNCOVER, self.ClickMode.FLAGLESS)
+        )
+        self.BOARD_IMAGE_NAMES: Final = (
+            'covered',
+            'unlocked',
+            'locked',
+            *(str(value) for value in range(self.MAX_SQUARE_VALUE + 1)),
+            *(f'flag_{count}' for count in self.MINE_COUNTS),
+            *(f'flag_{count}_wrong' for count in self.MINE_COUNTS),
+            *(f'mine_{count}' for count in self.MINE_COUNTS),
+            *(f'mine_{count}_explode' for count in self.MINE_COUNTS),
+        )
+        self.UI_IMAGE_NAMES: Final = (
+            'new',
+            'held',
+            'shocked',
+            'win',
+            'lose',
+            'uncover',
+            'flag',
+            'leaderboard',
+        )
 
         # Instance level UI elements
         self._hidden_root = tk.Tk()
@@ -99,6 +150,12 @@ class FreeFormMinesweeper:
         self.leaderboard_button = ttk.Button(self.mswpr_frame)
         self.play_button = ttk.Button(self.mswpr_frame)
         self.stop_button = ttk.Button(self.mswpr_frame)
+        self.section_columns: dict[ttk.Widget, int] = {
+            self.presets_frame: 0,
+            self.diff_frame: 4,
+            self.controls_frame: 5,
+        }
+        self.section_visibility: dict[ttk.Widget, bool] = {}
 
         # Options
         self.rows = tk.IntVar(value=28)
@@ -113,7 +170,7 @@ class FreeFormMinesweeper:
         self.ui_scale = tk.StringVar(value=self.LARGE_SCALE)
         self.ui_scale.trace_add('write', lambda *_: self.ui_scale_trace())
 
-        self.theme_option = tk.StringVar(value=self.ih.ImageTheme.LIGHT.value)
+        self.theme_option = tk.StringVar(value=self.LIGHT_THEME_KEY)
         self.theme_option.trace_add('write', lambda *_: self.theme_option_trace())
 
         self.multimine = tk.BooleanVar(value=False)
@@ -145,7 +202,7 @@ class FreeFormMinesweeper:
         self.classic_ui.trace_add('write', lambda *_: self.classic_ui_trace())
 
         # Values related to setting the options
-        self.theme: ImageHandler.ImageTheme = self.ih.ImageTheme.LIGHT
+        self.theme: ImageHandler.ImageTheme = self.LIGHT_THEME
         self.background_colour = self.LIGHT_BACKGROUND_COLOUR
         self.ui_colour = self.LIGHT_UI_COLOUR
         self.text_colour = self.LIGHT_TEXT_COLOUR
@@ -156,23 +213,57 @@ class FreeFormMinesweeper:
         self.board_square_size_px = int(self.board_square_size.value.split('x')[0])
         self.mode_key_down = False
         self.ignore_toggle_key_held = True
+        self.board_images: dict[str, tk.PhotoImage] = {}
+        self.number_images: tuple[tk.PhotoImage, ...] = ()
+        self.flag_images: dict[int, tk.PhotoImage] = {}
+        self.wrong_flag_images: dict[int, tk.PhotoImage] = {}
+        self.mine_images: dict[int, tk.PhotoImage] = {}
+        self.exploded_mine_images: dict[int, tk.PhotoImage] = {}
+        self.sevseg_images: tuple[tk.PhotoImage, ...] = ()
+        self.ui_images: dict[str, tk.PhotoImage] = {}
+        self.ui_button_images: dict[ttk.Widget, tk.PhotoImage] = {}
+        self.flag_labels: tuple[ttk.Label, ...] = ()
+        self.timer_labels: tuple[ttk.Label, ...] = ()
+        self.sevseg_label_images: dict[ttk.Label, tk.PhotoImage] = {}
+        self.menu_buttons: list[ttk.Widget] = []
+        self.regular_menu_buttons: list[ttk.Widget] = []
+        self.menu_options: dict[str, Any] = {}
+        self.dialogues: dict[str, ReusableDialogue] = {}
 
         # Game instance variables
         self.difficulty = tk.DoubleVar(value=self.DIFF_EASY)
         self.state = self.State.DRAW
+        self.guarded = False
         self.click_mode = tk.StringVar(value=self.ClickMode.UNCOVER)
         self.click_mode.trace_add('write', lambda *_: self.click_mode_trace())
-        self.draw_history: list[list[BoardSquare]] = []
-        self.draw_history_buffer: list[list[BoardSquare]] = []
-        self.draw_history_step: list[BoardSquare] = []
+        self.draw_history: deque[array[int]] = deque(maxlen=self.HISTORY_LENGTH)
+        self.draw_history_buffer: deque[array[int]] = deque(
+            maxlen=self.HISTORY_LENGTH
+        )
+        self.draw_history_step: set[BoardSquare] = set()
+        self.board_squares: list[list[BoardSquare]] = []
+        self.squares: list[BoardSquare] = []
+        self.square_pool: list[BoardSquare] = []
         self.num_mines = 0
         self.squares_cleared = 0
         self.flags_placed = 0
         self.squares_to_win = 0
         self.time_elapsed = 0.0
+        self.timer_start: float | None = None
+        self.timer_job: str | None = None
+        self.flag_counter_update_pending = False
         self.currently_held_square = None
+        self.drag_square: BoardSquare | None = None
+        self.motion_square: BoardSquare | None = None
+        self.board_origin = (0, 0)
+
+        # Release Manager, created before the toolbar as its Help menu reads it
+        self.rm = ReleaseManager(self.game_root)
 
         # Set up all UI elements, split into methods for readability
+        self.update_board_images()
+        self.update_sevseg_images()
+        self.update_ui_images()
         self.init_style()
         self.init_window()
         self.init_toolbar()
@@ -180,11 +271,8 @@ class FreeFormMinesweeper:
         self.game_root.update()
         self.init_board()
         self.init_keybinds()
-        self.game_root.title('FreeForm Minesweeper')
-        self.alive = True
 
-        # Release Manager
-        self.rm = ReleaseManager(self.game_root)
+        # Check for a newer release once the window is ready
         if not self.rm.is_release_up_to_date():
             self.rm.outdated_notice()
 
@@ -195,23 +283,24 @@ class FreeFormMinesweeper:
         self.set_guard()
 
         rows = self.rows.get()
-        num_rows_present = 0
-        for square in self.board_frame.grid_slaves():
-            assert isinstance(square, BoardSquare)
-            row = square.position[0]
-            num_rows_present = max(num_rows_present, row)
-        self.board_frame.config(height=self.board_square_size_px * rows)
-        self.game_root.update_idletasks()
-        self.game_root.update()
-        if num_rows_present < rows - 1:
-            for x in range(num_rows_present + 1, rows):
-                for y in range(self.columns.get()):
-                    self.make_square(x, y)
-        elif num_rows_present > rows - 1:
-            for i in range(num_rows_present, rows - 1, -1):
-                for widget in self.board_frame.grid_slaves(row=i):
-                    widget.grid_forget()
-                    widget.destroy()
+        num_rows_present = len(self.board_squares)
+        with self.batched_updates():
+            self.board_frame.config(height=self.board_square_size_px * rows)
+            if num_rows_present < rows:
+                unlocked_image = self.board_images['unlocked']
+                columns = range(self.columns.get())
+                for x in range(num_rows_present, rows):
+                    self.board_squares.append(
+                        [self.make_square(x, y, unlocked_image) for y in columns]
+                    )
+            elif num_rows_present > rows:
+                for board_row in self.board_squares[rows:]:
+                    for square in board_row:
+                        square.grid_forget()
+                        self.square_pool.append(square)
+                del self.board_squares[rows:]
+        self.index_squares()
+        self.clear_history()
 
         self.unset_guard()
 
@@ -220,23 +309,22 @@ class FreeFormMinesweeper:
         self.set_guard()
 
         columns = self.columns.get()
-        num_columns_present = 0
-        for square in self.board_frame.grid_slaves():
-            assert isinstance(square, BoardSquare)
-            column = square.position[1]
-            num_columns_present = max(num_columns_present, column)
-        self.board_frame.config(width=self.board_square_size_px * columns)
-        self.game_root.update_idletasks()
-        self.game_root.update()
-        if num_columns_present < columns - 1:
-            for y in range(num_columns_present + 1, columns):
-                for x in range(self.rows.get()):
-                    self.make_square(x, y)
-        elif num_columns_present > columns - 1:
-            for i in range(num_columns_present, columns - 1, -1):
-                for widget in self.board_frame.grid_slaves(column=i):
-                    widget.grid_forget()
-                    widget.destroy()
+        num_columns_present = len(self.board_squares[0]) if self.board_squares else 0
+        with self.batched_updates():
+            self.board_frame.config(width=self.board_square_size_px * columns)
+            if num_columns_present < columns:
+                unlocked_image = self.board_images['unlocked']
+                for x, board_row in enumerate(self.board_squares):
+                    for y in range(num_columns_present, columns):
+                        board_row.append(self.make_square(x, y, unlocked_image))
+            elif num_columns_present > columns:
+                for board_row in self.board_squares:
+                    for square in board_row[columns:]:
+                        square.grid_forget()
+                        self.square_pool.append(square)
+                    del board_row[columns:]
+        self.index_squares()
+        self.clear_history()
         self.ui_collapse()
 
         self.unset_guard()
@@ -245,9 +333,10 @@ class FreeFormMinesweeper:
         """Update the board square size."""
         self.set_guard()
 
-        if self.board_scale.get() == self.SMALL_SCALE:
+        board_scale = self.board_scale.get()
+        if board_scale == self.SMALL_SCALE:
             self.board_square_size = self.ih.ImageSize.SM_SQUARE
-        elif self.board_scale.get() == self.LARGE_SCALE:
+        elif board_scale == self.LARGE_SCALE:
             self.board_square_size = self.ih.ImageSize.LG_SQUARE
         self.board_square_size_px = int(self.board_square_size.value.split('x')[0])
         self.board_frame.config(
@@ -255,22 +344,8 @@ class FreeFormMinesweeper:
             width=self.board_square_size_px * self.columns.get(),
         )
 
-        for square in self.board_frame.grid_slaves():
-            assert isinstance(square, BoardSquare)
-            if square.enabled:
-                square.image = self.ih.lookup(
-                    self.board_square_size,
-                    self.theme,
-                    self.ih.ImageCategory.BOARD,
-                    'covered',
-                )
-            else:
-                square.image = self.ih.lookup(
-                    self.board_square_size,
-                    self.theme,
-                    self.ih.ImageCategory.BOARD,
-                    'unlocked',
-                )
+        self.update_board_images()
+        self.redraw_board()
         self.ui_collapse()
 
         self.unset_guard()
@@ -278,8 +353,10 @@ class FreeFormMinesweeper:
     def ui_scale_trace(self) -> None:
         """Update the UI size."""
         self.set_guard()
+        self.clear_dialogues()
 
-        if self.ui_scale.get() == self.SMALL_SCALE:
+        ui_scale = self.ui_scale.get()
+        if ui_scale == self.SMALL_SCALE:
             self.ui_square_size = self.ih.ImageSize.SM_SQUARE
             self.sevseg_size = self.ih.ImageSize.SM_SEVSEG
             self.style.configure(
@@ -300,7 +377,7 @@ class FreeFormMinesweeper:
                 'FFMS.TEntry',
                 font=self.SMALL_FONT,
             )
-        elif self.ui_scale.get() == self.LARGE_SCALE:
+        elif ui_scale == self.LARGE_SCALE:
             self.ui_square_size = self.ih.ImageSize.LG_SQUARE
             self.sevseg_size = self.ih.ImageSize.LG_SEVSEG
             self.style.configure(
@@ -322,42 +399,13 @@ class FreeFormMinesweeper:
                 font=self.LARGE_FONT,
             )
 
-        for label in chain(
-            self.flags_frame.grid_slaves(), self.timer_frame.grid_slaves()
-        ):
-            assert isinstance(label, ttk.Label)
-            label.config(
-                image=self.ih.lookup(
-                    self.sevseg_size,
-                    self.theme,
-                    self.ih.ImageCategory.SEVSEG,
-                    '0',
-                )
-            )
-        self.mode_switch_button.config(
-            image=self.ih.lookup(
-                self.ui_square_size,
-                self.theme,
-                self.ih.ImageCategory.UI,
-                'uncover',
-            ),
-        )
-        self.new_game_button.config(
-            image=self.ih.lookup(
-                self.ui_square_size,
-                self.theme,
-                self.ih.ImageCategory.UI,
-                'new',
-            ),
-        )
-        self.leaderboard_button.config(
-            image=self.ih.lookup(
-                self.ui_square_size,
-                self.theme,
-                self.ih.ImageCategory.UI,
-                'leaderboard',
-            ),
-        )
+        self.update_sevseg_images()
+        self.reset_flag_counter()
+        self.reset_timer()
+        self.update_ui_images()
+        self.set_ui_button_image(self.mode_switch_button, 'uncover')
+        self.set_ui_button_image(self.new_game_button, 'new')
+        self.set_ui_button_image(self.leaderboard_button, 'leaderboard')
         self.ui_collapse()
 
         self.unset_guard()
@@ -365,70 +413,29 @@ class FreeFormMinesweeper:
     def theme_option_trace(self) -> None:
         """Change the theme."""
         self.set_guard()
-        if self.theme_option.get() == self.ih.ImageTheme.LIGHT.value:
-            self.theme = self.ih.ImageTheme.LIGHT
+        self.clear_dialogues()
+        theme_option = self.theme_option.get()
+        if theme_option == self.LIGHT_THEME_KEY:
+            self.theme = self.LIGHT_THEME
             self.background_colour = self.LIGHT_BACKGROUND_COLOUR
             self.text_colour = self.LIGHT_TEXT_COLOUR
             self.ui_colour = self.LIGHT_UI_COLOUR
-        elif self.theme_option.get() == self.ih.ImageTheme.DARK.value:
-            self.theme = self.ih.ImageTheme.DARK
+        elif theme_option == self.DARK_THEME_KEY:
+            self.theme = self.DARK_THEME
             self.background_colour = self.DARK_BACKGROUND_COLOUR
             self.text_colour = self.DARK_TEXT_COLOUR
             self.ui_colour = self.DARK_UI_COLOUR
 
-        for square in self.board_frame.grid_slaves():
-            assert isinstance(square, BoardSquare)
-            if square.enabled:
-                square.image = self.ih.lookup(
-                    self.board_square_size,
-                    self.theme,
-                    self.ih.ImageCategory.BOARD,
-                    'covered',
-                )
-            else:
-                square.image = self.ih.lookup(
-                    self.board_square_size,
-                    self.theme,
-                    self.ih.ImageCategory.BOARD,
-                    'unlocked',
-                )
+        self.update_board_images()
+        self.update_sevseg_images()
+        self.redraw_board()
 
-        for label in chain(
-            self.flags_frame.grid_slaves(), self.timer_frame.grid_slaves()
-        ):
-            assert isinstance(label, ttk.Label)
-            label.config(
-                image=self.ih.lookup(
-                    self.sevseg_size,
-                    self.theme,
-                    self.ih.ImageCategory.SEVSEG,
-                    '0',
-                )
-            )
-        self.mode_switch_button.config(
-            image=self.ih.lookup(
-                self.ui_square_size,
-                self.theme,
-                self.ih.ImageCategory.UI,
-                'uncover',
-            ),
-        )
-        self.new_game_button.config(
-            image=self.ih.lookup(
-                self.ui_square_size,
-                self.theme,
-                self.ih.ImageCategory.UI,
-                'new',
-            ),
-        )
-        self.leaderboard_button.config(
-            image=self.ih.lookup(
-                self.ui_square_size,
-                self.theme,
-                self.ih.ImageCategory.UI,
-                'leaderboard',
-            ),
-        )
+        self.reset_flag_counter()
+        self.reset_timer()
+        self.update_ui_images()
+        self.set_ui_button_image(self.mode_switch_button, 'uncover')
+        self.set_ui_button_image(self.new_game_button, 'new')
+        self.set_ui_button_image(self.leaderboard_button, 'leaderboard')
         self.style.configure(
             'FFMS.TFrame',
             background=self.background_colour,
@@ -457,20 +464,14 @@ class FreeFormMinesweeper:
             activeforeground=self.text_colour,
             selectcolor=self.text_colour,
         )
+        self.update_menu_options()
         menu_q = [self.menubar]
         while menu_q:
             current_menu = menu_q.pop(0)
             for child in current_menu.children.values():
                 if isinstance(child, tk.Menu):
                     menu_q.append(child)
-            current_menu.config(
-                font=self.SMALL_FONT,
-                bg=self.ui_colour,
-                fg=self.text_colour,
-                activebackground=self.background_colour,
-                activeforeground=self.text_colour,
-                selectcolor=self.text_colour,
-            )
+            current_menu.config(**self.menu_options)
         self.unset_guard()
 
     def multimine_trace(self) -> None:
@@ -492,58 +493,36 @@ class FreeFormMinesweeper:
         if self.adaptive_ui.get():
             self.ui_collapse()
         elif not self.classic_ui.get():
-            self.controls_frame.grid()
-            self.menu_frame.grid_columnconfigure(5, weight=1)
-            self.diff_frame.grid()
-            self.menu_frame.grid_columnconfigure(4, weight=1)
-            self.presets_frame.grid()
-            self.menu_frame.grid_columnconfigure(0, weight=1)
+            self.set_section_visible(self.controls_frame, True)
+            self.set_section_visible(self.diff_frame, True)
+            self.set_section_visible(self.presets_frame, True)
 
     def click_mode_trace(self) -> None:
-        if self.click_mode.get() == self.ClickMode.UNCOVER:
-            self.mode_switch_button.config(
-                image=self.ih.lookup(
-                    self.ui_square_size,
-                    self.theme,
-                    self.ih.ImageCategory.UI,
-                    'uncover',
-                )
-            )
-        elif self.click_mode.get() == self.ClickMode.FLAG:
-            self.mode_switch_button.config(
-                image=self.ih.lookup(
-                    self.ui_square_size,
-                    self.theme,
-                    self.ih.ImageCategory.UI,
-                    'flag',
-                )
-            )
+        click_mode = self.click_mode.get()
+        if click_mode == self.ClickMode.UNCOVER:
+            self.set_ui_button_image(self.mode_switch_button, 'uncover')
+        elif click_mode == self.ClickMode.FLAG:
+            self.set_ui_button_image(self.mode_switch_button, 'flag')
 
     def mode_key_behaviour_trace(self) -> None:
-        if self.mode_key_behaviour.get() == 'hold':
+        mode_key_behaviour = self.mode_key_behaviour.get()
+        if mode_key_behaviour == 'hold':
             self.game_root.bind(
                 '<KeyRelease-Shift_L>',
                 self.toggle_click_mode,
             )
             self.ignore_toggle_key_held = True
-        elif self.mode_key_behaviour.get() == 'toggle':
+        elif mode_key_behaviour == 'toggle':
             self.game_root.unbind('<KeyRelease-Shift_L>')
             self.ignore_toggle_key_held = False
         self.mode_key_down = False
 
     def classic_ui_trace(self) -> None:
         if self.classic_ui.get():
-            self.presets_frame.grid_remove()
-            self.menu_frame.grid_columnconfigure(0, weight=0)
-
-            self.diff_frame.grid_remove()
-            self.menu_frame.grid_columnconfigure(4, weight=0)
-
-            self.controls_frame.grid_remove()
-            self.menu_frame.grid_columnconfigure(5, weight=0)
-
-            self.leaderboard_button.grid_remove()
-            self.new_game_button.grid_configure(padx=0)
+            self.set_section_visible(self.presets_frame, False)
+            self.set_section_visible(self.diff_frame, False)
+            self.set_section_visible(self.controls_frame, False)
+            self.set_section_visible(self.leaderboard_button, False)
 
             self.mode_switch_button.grid_remove()
 
@@ -571,17 +550,32 @@ class FreeFormMinesweeper:
             self.columns.set(30)
         self.multimine_diff_inc.set(0.25)
         self.multimine_likelihood.set(0.5)
-        self.theme_option.set(self.ih.ImageTheme.LIGHT.value)
+        self.theme_option.set(self.LIGHT_THEME_KEY)
         self.prompt_leaderboard_save.set(True)
 
     def check_for_updates(self) -> None:
-        if self.rm.is_release_up_to_date():
-            AcknowledgementDialogue(
-                self.game_root,
-                message='This release is up to date.',
-            )
-        else:
-            self.rm.outdated_notice(force_message=True)
+        with self.paused_timer():
+            if self.rm.is_release_up_to_date():
+                AcknowledgementDialogue(
+                    self.game_root,
+                    message='This release is up to date.',
+                )
+            else:
+                self.rm.outdated_notice(force_message=True)
+
+    def show_about(self) -> None:
+        """Show the about dialogue, with the version read when it is opened."""
+        self.show_dialogue(
+            'about',
+            ReusableAcknowledgementWithLinkDialogue,
+            self.game_root,
+            (
+                f'FreeForm Minesweeper ({self.rm.version}), created by KittyKittyKitKat.\n'
+                'Check out my GitHub!'
+            ),
+            ('GitHub Page', self.GITHUB_PAGE),
+            title='FreeForm Minesweeper About',
+        )
 
     # UI Generation Methods
 
@@ -655,12 +649,12 @@ class FreeFormMinesweeper:
         self.game_root.title('FreeForm Minesweeper (Loading...)')
         self.game_root.iconname('FreeForm Minesweeper')
         self.game_root.option_add('*tearOff', False)
-        self.game_root.protocol('WM_DELETE_WINDOW', lambda: self.quit_game(False))
+        self.game_root.protocol('WM_DELETE_WINDOW', partial(self.quit_game, False))
         self.game_root.iconphoto(
             False,
             self.ih.lookup(
                 self.ih.ImageSize.LG_SQUARE,
-                self.ih.ImageTheme.LIGHT,
+                self.LIGHT_THEME,
                 self.ih.ImageCategory.UI,
                 'new',
             ),
@@ -673,6 +667,32 @@ class FreeFormMinesweeper:
             width=self.board_square_size_px * self.columns.get(),
         )
         self.board_frame.grid(row=1, column=0, sticky=tk.NSEW)
+        self.game_root.bind('<Configure>', self.board_origin_handler)
+        self.game_root.bind_class(
+            self.BOARD_SQUARE_TAG,
+            '<Button-1>',
+            self.left_mouse_press_handler,
+        )
+        self.game_root.bind_class(
+            self.BOARD_SQUARE_TAG,
+            '<Button-3>',
+            self.right_mouse_press_handler,
+        )
+        self.game_root.bind_class(
+            self.BOARD_SQUARE_TAG,
+            '<B1-Motion>',
+            self.mouse_motion_handler,
+        )
+        self.game_root.bind_class(
+            self.BOARD_SQUARE_TAG,
+            '<ButtonRelease-1>',
+            self.mouse_release_handler,
+        )
+        self.game_root.bind_class(
+            self.BOARD_SQUARE_TAG,
+            '<Double-Button-1>',
+            self.double_mouse_handler,
+        )
 
     def init_keybinds(self) -> None:
         self.game_root.bind(
@@ -722,22 +742,23 @@ class FreeFormMinesweeper:
             self.toggle_click_mode,
         )
 
+    def update_menu_options(self) -> None:
+        """Update the options shared by every menu to match the current theme."""
+        self.menu_options = {
+            'font': self.SMALL_FONT,
+            'bg': self.ui_colour,
+            'fg': self.text_colour,
+            'activebackground': self.background_colour,
+            'activeforeground': self.text_colour,
+            'selectcolor': self.text_colour,
+        }
+
     def init_toolbar(self) -> None:
-        self.menubar.config(
-            font=self.SMALL_FONT,
-            bg=self.ui_colour,
-            fg=self.text_colour,
-            activebackground=self.background_colour,
-            activeforeground=self.text_colour,
-        )
+        self.update_menu_options()
+        self.menubar.config(**self.menu_options)
         file_menu = tk.Menu(
             self.menubar,
-            font=self.SMALL_FONT,
-            bg=self.ui_colour,
-            fg=self.text_colour,
-            activebackground=self.background_colour,
-            activeforeground=self.text_colour,
-            selectcolor=self.text_colour,
+            **self.menu_options,
         )
         file_menu.add_command(
             label='Load Board',
@@ -751,64 +772,54 @@ class FreeFormMinesweeper:
         )
         presets_menu = tk.Menu(
             self.menubar,
-            font=self.SMALL_FONT,
-            bg=self.ui_colour,
-            fg=self.text_colour,
-            activebackground=self.background_colour,
-            activeforeground=self.text_colour,
-            selectcolor=self.text_colour,
+            **self.menu_options,
         )
         presets_menu.add_command(
             label='Easy',
-            command=lambda: self.load_board('presets/easy.ffmnswpr', self.DIFF_EASY),
+            command=partial(self.load_board, 'presets/easy.ffmnswpr', self.DIFF_EASY),
         )
         presets_menu.add_command(
             label='Medium',
-            command=lambda: self.load_board(
-                'presets/medium.ffmnswpr', self.DIFF_MEDIUM
+            command=partial(
+                self.load_board, 'presets/medium.ffmnswpr', self.DIFF_MEDIUM
             ),
         )
         presets_menu.add_command(
             label='Hard',
-            command=lambda: self.load_board('presets/hard.ffmnswpr', self.DIFF_HARD),
+            command=partial(self.load_board, 'presets/hard.ffmnswpr', self.DIFF_HARD),
         )
         presets_menu.add_command(
             label='Expert',
-            command=lambda: self.load_board(
-                'presets/expert.ffmnswpr', self.DIFF_EXPERT
+            command=partial(
+                self.load_board, 'presets/expert.ffmnswpr', self.DIFF_EXPERT
             ),
         )
         file_menu.add_cascade(label='Presets', menu=presets_menu)
         samples_menu = tk.Menu(
             self.menubar,
-            font=self.SMALL_FONT,
-            bg=self.ui_colour,
-            fg=self.text_colour,
-            activebackground=self.background_colour,
-            activeforeground=self.text_colour,
-            selectcolor=self.text_colour,
+            **self.menu_options,
         )
         samples_menu.add_command(
             label='Mine',
-            command=lambda: self.load_board('sample_boards/mine.ffmnswpr'),
+            command=partial(self.load_board, 'sample_boards/mine.ffmnswpr'),
         )
         samples_menu.add_command(
             label='Flag',
-            command=lambda: self.load_board('sample_boards/flag.ffmnswpr'),
+            command=partial(self.load_board, 'sample_boards/flag.ffmnswpr'),
         )
         samples_menu.add_command(
             label='Trophy',
-            command=lambda: self.load_board('sample_boards/trophy.ffmnswpr'),
+            command=partial(self.load_board, 'sample_boards/trophy.ffmnswpr'),
         )
         samples_menu.add_command(
             label='Win Face',
-            command=lambda: self.load_board('sample_boards/winface.ffmnswpr'),
+            command=partial(self.load_board, 'sample_boards/winface.ffmnswpr'),
         )
         file_menu.add_cascade(label='Sample Boards', menu=samples_menu)
         file_menu.add_separator()
         file_menu.add_command(
             label='Leaderboard',
-            command=lambda: LeaderboardViewDialogue(self.game_root),
+            command=partial(LeaderboardViewDialogue, self.game_root),
         )
         file_menu.add_separator()
         file_menu.add_command(
@@ -822,12 +833,7 @@ class FreeFormMinesweeper:
 
         edit_menu = tk.Menu(
             self.menubar,
-            font=self.SMALL_FONT,
-            bg=self.ui_colour,
-            fg=self.text_colour,
-            activebackground=self.background_colour,
-            activeforeground=self.text_colour,
-            selectcolor=self.text_colour,
+            **self.menu_options,
         )
         edit_menu.add_command(
             label='Undo',
@@ -863,34 +869,24 @@ class FreeFormMinesweeper:
         edit_menu.add_command(label='Close')
         self.menubar.add_cascade(label='Edit', menu=edit_menu)
 
-        game_menu = tk.Menu(
+        self.game_menu = tk.Menu(
             self.menubar,
-            font=self.SMALL_FONT,
-            bg=self.ui_colour,
-            fg=self.text_colour,
-            activebackground=self.background_colour,
-            activeforeground=self.text_colour,
-            selectcolor=self.text_colour,
+            **self.menu_options,
         )
-        game_menu.add_command(label='Play Game', command=self.start_game)
-        game_menu.add_command(
+        self.game_menu.add_command(label='Play Game', command=self.start_game)
+        self.game_menu.add_command(
             label='Stop Playing',
             state=tk.DISABLED,
             command=self.stop_game,
         )
-        game_menu.add_command(
+        self.game_menu.add_command(
             label='New Game',
             state=tk.DISABLED,
             command=self.new_game,
         )
         flagging_menu = tk.Menu(
             self.menubar,
-            font=self.SMALL_FONT,
-            bg=self.ui_colour,
-            fg=self.text_colour,
-            activebackground=self.background_colour,
-            activeforeground=self.text_colour,
-            selectcolor=self.text_colour,
+            **self.menu_options,
         )
         flagging_menu.add_radiobutton(
             label='Uncover Mines',
@@ -902,19 +898,14 @@ class FreeFormMinesweeper:
             value=self.ClickMode.FLAG,
             variable=self.click_mode,
         )
-        game_menu.add_cascade(
+        self.game_menu.add_cascade(
             label='Flagging Mode',
             state=tk.DISABLED,
             menu=flagging_menu,
         )
         shift_menu = tk.Menu(
             self.menubar,
-            font=self.SMALL_FONT,
-            bg=self.ui_colour,
-            fg=self.text_colour,
-            activebackground=self.background_colour,
-            activeforeground=self.text_colour,
-            selectcolor=self.text_colour,
+            **self.menu_options,
         )
         shift_menu.add_radiobutton(
             label='Hold (Left Shift)',
@@ -926,21 +917,16 @@ class FreeFormMinesweeper:
             value='toggle',
             variable=self.mode_key_behaviour,
         )
-        game_menu.add_cascade(label='Flag Mode Behaviour', menu=shift_menu)
-        game_menu.add_checkbutton(
+        self.game_menu.add_cascade(label='Flag Mode Behaviour', menu=shift_menu)
+        self.game_menu.add_checkbutton(
             label='Leaderboard Save Prompt',
             variable=self.prompt_leaderboard_save,
         )
-        self.menubar.add_cascade(label='Game', menu=game_menu)
+        self.menubar.add_cascade(label='Game', menu=self.game_menu)
 
         options_menu = tk.Menu(
             self.menubar,
-            font=self.SMALL_FONT,
-            bg=self.ui_colour,
-            fg=self.text_colour,
-            activebackground=self.background_colour,
-            activeforeground=self.text_colour,
-            selectcolor=self.text_colour,
+            **self.menu_options,
         )
         options_menu.add_checkbutton(
             label='Multimine Mode',
@@ -956,12 +942,7 @@ class FreeFormMinesweeper:
         )
         diff_menu = tk.Menu(
             options_menu,
-            font=self.SMALL_FONT,
-            bg=self.ui_colour,
-            fg=self.text_colour,
-            activebackground=self.background_colour,
-            activeforeground=self.text_colour,
-            selectcolor=self.text_colour,
+            **self.menu_options,
         )
         diff_menu.add_radiobutton(
             label=f'{self.DIFF_EASY:.0%} Mines',
@@ -986,12 +967,7 @@ class FreeFormMinesweeper:
         options_menu.add_cascade(label='Difficulty', menu=diff_menu)
         bds_menu = tk.Menu(
             self.menubar,
-            font=self.SMALL_FONT,
-            bg=self.ui_colour,
-            fg=self.text_colour,
-            activebackground=self.background_colour,
-            activeforeground=self.text_colour,
-            selectcolor=self.text_colour,
+            **self.menu_options,
         )
         bds_menu.add_radiobutton(
             label='Small',
@@ -1006,12 +982,7 @@ class FreeFormMinesweeper:
         options_menu.add_cascade(label='Board Scale', menu=bds_menu)
         uis_menu = tk.Menu(
             self.menubar,
-            font=self.SMALL_FONT,
-            bg=self.ui_colour,
-            fg=self.text_colour,
-            activebackground=self.background_colour,
-            activeforeground=self.text_colour,
-            selectcolor=self.text_colour,
+            **self.menu_options,
         )
         uis_menu.add_radiobutton(
             label='Small',
@@ -1034,28 +1005,26 @@ class FreeFormMinesweeper:
         )
         theme_menu = tk.Menu(
             self.menubar,
-            font=self.SMALL_FONT,
-            bg=self.ui_colour,
-            fg=self.text_colour,
-            activebackground=self.background_colour,
-            activeforeground=self.text_colour,
-            selectcolor=self.text_colour,
+            **self.menu_options,
         )
         theme_menu.add_radiobutton(
             label='Light',
-            value=self.ih.ImageTheme.LIGHT.value,
+            value=self.LIGHT_THEME_KEY,
             variable=self.theme_option,
         )
         theme_menu.add_radiobutton(
             label='Dark',
-            value=self.ih.ImageTheme.DARK.value,
+            value=self.DARK_THEME_KEY,
             variable=self.theme_option,
         )
         options_menu.add_cascade(label='Theme', menu=theme_menu)
         options_menu.add_separator()
         options_menu.add_command(
             label='More...',
-            command=lambda: SettingsDialogue(
+            command=partial(
+                self.show_dialogue,
+                'settings',
+                SettingsDialogue,
                 self.game_root,
                 {
                     'Rows': (3, 64, 1, self.rows),
@@ -1083,28 +1052,18 @@ class FreeFormMinesweeper:
 
         help_menu = tk.Menu(
             self.menubar,
-            font=self.SMALL_FONT,
-            bg=self.ui_colour,
-            fg=self.text_colour,
-            activebackground=self.background_colour,
-            activeforeground=self.text_colour,
-            selectcolor=self.text_colour,
+            **self.menu_options,
         )
         help_menu.add_command(
             label='About...',
-            command=lambda: AcknowledgementWithLinkDialogue(
-                self.game_root,
-                (
-                    f'FreeForm Minesweeper ({self.rm.version}), created by KittyKittyKitKat.\n'
-                    'Check out my GitHub!'
-                ),
-                ('GitHub Page', self.GITHUB_PAGE),
-                title='FreeForm Minesweeper About',
-            ),
+            command=self.show_about,
         )
         help_menu.add_command(
             label='Tutorial',
-            command=lambda: AcknowledgementWithLinkDialogue(
+            command=partial(
+                self.show_dialogue,
+                'tutorial',
+                ReusableAcknowledgementWithLinkDialogue,
                 self.game_root,
                 'Click the link to open the tutorial page in your browser.',
                 ('Tutorial', self.TUTORIAL_PAGE),
@@ -1117,7 +1076,10 @@ class FreeFormMinesweeper:
         )
         help_menu.add_command(
             label='Copyright',
-            command=lambda: AcknowledgementDialogue(
+            command=partial(
+                self.show_dialogue,
+                'copyright',
+                ReusableAcknowledgementDialogue,
                 self.game_root,
                 'Copyright \N{COPYRIGHT SIGN} Nyxian Harris-Palmer 2024. All rights reserved.',
                 title='FreeForm Minesweeper Copyright',
@@ -1129,57 +1091,76 @@ class FreeFormMinesweeper:
 
         self.game_root.config(menu=self.menubar)
 
+    def show_dialogue(
+        self,
+        name: str,
+        dialogue_type: type[ReusableDialogue],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Show a reusable dialogue, creating it the first time it is needed.
+
+        Args:
+            name: Name the dialogue is cached under.
+            dialogue_type: Class of the dialogue.
+            *args: Positional arguments used to create the dialogue.
+            **kwargs: Keyword arguments used to create the dialogue.
+        """
+        dialogue = self.dialogues.get(name)
+        with self.paused_timer():
+            if dialogue is None:
+                self.dialogues[name] = dialogue_type(*args, **kwargs)
+            else:
+                dialogue.show()
+
+    def clear_dialogues(self) -> None:
+        """Destroy the cached dialogues, so they are rebuilt with the new style."""
+        for dialogue in self.dialogues.values():
+            dialogue.destroy()
+        self.dialogues.clear()
+
     def init_menu(self) -> None:
         """Set up menu for the game"""
+        button_options: dict[str, Any] = {
+            'style': 'FFMS.Toolbutton',
+            'takefocus': False,
+            'cursor': 'hand2',
+        }
         self.menu_frame.config(padding=(0, self.UI_PADDING, 0))
-        self.menu_frame.grid_columnconfigure(0, weight=1)
-        self.menu_frame.grid_columnconfigure(1, weight=1)
-        self.menu_frame.grid_columnconfigure(2, weight=1)
-        self.menu_frame.grid_columnconfigure(3, weight=1)
-        self.menu_frame.grid_columnconfigure(4, weight=1)
-        self.menu_frame.grid_columnconfigure(5, weight=1)
-
-        self.presets_frame.grid_columnconfigure(0, weight=1)
-        self.presets_frame.grid_columnconfigure(1, weight=1)
+        self.menu_frame.grid_columnconfigure((0, 1, 2, 3, 4, 5), weight=1)
+
+        self.presets_frame.grid_columnconfigure((0, 1), weight=1)
         preset_easy = ttk.Button(
             self.presets_frame,
             text='Easy',
             width=6,
-            style='FFMS.Toolbutton',
-            command=lambda: self.load_board('presets/easy.ffmnswpr', self.DIFF_EASY),
-            takefocus=False,
-            cursor='hand2',
+            command=partial(self.load_board, 'presets/easy.ffmnswpr', self.DIFF_EASY),
+            **button_options,
         )
         preset_medium = ttk.Button(
             self.presets_frame,
             text='Medium',
             width=6,
-            style='FFMS.Toolbutton',
-            command=lambda: self.load_board(
-                'presets/medium.ffmnswpr', self.DIFF_MEDIUM
+            command=partial(
+                self.load_board, 'presets/medium.ffmnswpr', self.DIFF_MEDIUM
             ),
-            takefocus=False,
-            cursor='hand2',
+            **button_options,
         )
         preset_hard = ttk.Button(
             self.presets_frame,
             text='Hard',
             width=6,
-            style='FFMS.Toolbutton',
-            command=lambda: self.load_board('presets/hard.ffmnswpr', self.DIFF_HARD),
-            takefocus=False,
-            cursor='hand2',
+            command=partial(self.load_board, 'presets/hard.ffmnswpr', self.DIFF_HARD),
+            **button_options,
         )
         preset_expert = ttk.Button(
             self.presets_frame,
             text='Expert',
             width=6,
-            style='FFMS.Toolbutton',
-            command=lambda: self.load_board(
-                'presets/expert.ffmnswpr', self.DIFF_EXPERT
+            command=partial(
+                self.load_board, 'presets/expert.ffmnswpr', self.DIFF_EXPERT
             ),
-            takefocus=False,
-            cursor='hand2',
+            **button_options,
         )
         preset_easy.grid(row=0, column=0, sticky=tk.NSEW)
         preset_medium.grid(row=0, column=1, sticky=tk.NSEW)
@@ -1187,87 +1168,41 @@ class FreeFormMinesweeper:
         preset_expert.grid(row=1, column=1, sticky=tk.NSEW)
         self.presets_frame.grid(row=0, column=0)
 
-        self.flags_frame.grid_columnconfigure(0, weight=1)
-        self.flags_frame.grid_columnconfigure(1, weight=1)
-        self.flags_frame.grid_columnconfigure(2, weight=1)
+        zero_img = self.sevseg_images[0]
+        self.flags_frame.grid_columnconfigure((0, 1, 2), weight=1)
         flag_left = ttk.Label(
             self.flags_frame,
-            image=self.ih.lookup(
-                self.sevseg_size,
-                self.theme,
-                self.ih.ImageCategory.SEVSEG,
-                '0',
-            ),
+            image=zero_img,
             style='FFMS.TLabel',
         )
         flag_mid = ttk.Label(
             self.flags_frame,
-            image=self.ih.lookup(
-                self.sevseg_size,
-                self.theme,
-                self.ih.ImageCategory.SEVSEG,
-                '0',
-            ),
+            image=zero_img,
             style='FFMS.TLabel',
         )
         flag_right = ttk.Label(
             self.flags_frame,
-            image=self.ih.lookup(
-                self.sevseg_size,
-                self.theme,
-                self.ih.ImageCategory.SEVSEG,
-                '0',
-            ),
+            image=zero_img,
             style='FFMS.TLabel',
         )
         flag_left.grid(row=0, column=0, sticky=tk.NSEW)
         flag_mid.grid(row=0, column=1, sticky=tk.NSEW)
         flag_right.grid(row=0, column=2, sticky=tk.NSEW)
+        self.flag_labels = (flag_left, flag_mid, flag_right)
         self.flags_frame.grid(row=0, column=1)
 
-        self.mode_switch_button.config(
-            image=self.ih.lookup(
-                self.ui_square_size,
-                self.theme,
-                self.ih.ImageCategory.UI,
-                'uncover',
-            ),
-            cursor='hand2',
-        )
+        self.set_ui_button_image(self.mode_switch_button, 'uncover')
+        self.mode_switch_button.config(cursor='hand2')
         self.mode_switch_button.bind('<Button-1>', self.toggle_click_mode)
         self.mode_switch_button.state([tk.DISABLED])
-        self.new_game_button.config(
-            image=self.ih.lookup(
-                self.ui_square_size,
-                self.theme,
-                self.ih.ImageCategory.UI,
-                'new',
-            ),
-            cursor='hand2',
-        )
+        self.set_ui_button_image(self.new_game_button, 'new')
+        self.new_game_button.config(cursor='hand2')
         self.new_game_button.state([tk.DISABLED])
-
-        def hold():
-            if self.state is not self.State.DRAW:
-                self.new_game_button.config(
-                    image=self.ih.lookup(
-                        self.ui_square_size,
-                        self.theme,
-                        self.ih.ImageCategory.UI,
-                        'held',
-                    )
-                )
-
-        self.new_game_button.bind('<Button-1>', lambda *_: hold())
-        self.new_game_button.bind('<ButtonRelease-1>', lambda *_: self.new_game())
+        self.new_game_button.bind('<Button-1>', self.new_game_press_handler)
+        self.new_game_button.bind('<ButtonRelease-1>', self.new_game_release_handler)
+        self.set_ui_button_image(self.leaderboard_button, 'leaderboard')
         self.leaderboard_button.config(
-            image=self.ih.lookup(
-                self.ui_square_size,
-                self.theme,
-                self.ih.ImageCategory.UI,
-                'leaderboard',
-            ),
-            command=lambda *_: LeaderboardViewDialogue(self.game_root),
+            command=partial(LeaderboardViewDialogue, self.game_root),
             takefocus=False,
             cursor='hand2',
         )
@@ -1286,9 +1221,7 @@ class FreeFormMinesweeper:
             cursor='hand2',
         )
 
-        self.mswpr_frame.grid_columnconfigure(0, weight=1)
-        self.mswpr_frame.grid_columnconfigure(1, weight=1)
-        self.mswpr_frame.grid_columnconfigure(2, weight=1)
+        self.mswpr_frame.grid_columnconfigure((0, 1, 2), weight=1)
         self.mode_switch_button.grid(row=0, column=0, pady=3, sticky=tk.NSEW)
         self.new_game_button.grid(
             row=0,
@@ -1303,48 +1236,29 @@ class FreeFormMinesweeper:
         self.play_button.grid(row=1, column=0, columnspan=3, sticky=tk.NSEW)
         self.mswpr_frame.grid(row=0, column=2)
 
-        self.timer_frame.grid_columnconfigure(0, weight=1)
-        self.timer_frame.grid_columnconfigure(1, weight=1)
-        self.timer_frame.grid_columnconfigure(2, weight=1)
+        self.timer_frame.grid_columnconfigure((0, 1, 2), weight=1)
         timer_left = ttk.Label(
             self.timer_frame,
-            image=self.ih.lookup(
-                self.sevseg_size,
-                self.theme,
-                self.ih.ImageCategory.SEVSEG,
-                '0',
-            ),
+            image=zero_img,
             style='FFMS.TLabel',
         )
         timer_mid = ttk.Label(
             self.timer_frame,
-            image=self.ih.lookup(
-                self.sevseg_size,
-                self.theme,
-                self.ih.ImageCategory.SEVSEG,
-                '0',
-            ),
+            image=zero_img,
             style='FFMS.TLabel',
         )
         timer_right = ttk.Label(
             self.timer_frame,
-            image=self.ih.lookup(
-                self.sevseg_size,
-                self.theme,
-                self.ih.ImageCategory.SEVSEG,
-                '0',
-            ),
+            image=zero_img,
             style='FFMS.TLabel',
         )
         timer_left.grid(row=0, column=0, sticky=tk.NSEW)
         timer_mid.grid(row=0, column=1, sticky=tk.NSEW)
         timer_right.grid(row=0, column=2, sticky=tk.NSEW)
+        self.timer_labels = (timer_left, timer_mid, timer_right)
         self.timer_frame.grid(row=0, column=3)
 
-        self.diff_frame.grid_columnconfigure(0, weight=1)
-        self.diff_frame.grid_columnconfigure(1, weight=1)
-        self.diff_frame.grid_columnconfigure(2, weight=1)
-        self.diff_frame.grid_columnconfigure(3, weight=1)
+        self.diff_frame.grid_columnconfigure((0, 1, 2, 3), weight=1)
         diff_label = ttk.Label(
             self.diff_frame,
             text='Difficulty',
@@ -1356,9 +1270,7 @@ class FreeFormMinesweeper:
             width=1,
             value=self.DIFF_EASY,
             variable=self.difficulty,
-            style='FFMS.Toolbutton',
-            takefocus=False,
-            cursor='hand2',
+            **button_options,
         )
         diff_2 = ttk.Radiobutton(
             self.diff_frame,
@@ -1366,27 +1278,21 @@ class FreeFormMinesweeper:
             width=1,
             value=self.DIFF_MEDIUM,
             variable=self.difficulty,
-            style='FFMS.Toolbutton',
-            takefocus=False,
-            cursor='hand2',
+            **button_options,
         )
         diff_3 = ttk.Radiobutton(
             self.diff_frame,
             text='3',
             value=self.DIFF_HARD,
             variable=self.difficulty,
-            style='FFMS.Toolbutton',
-            takefocus=False,
-            cursor='hand2',
+            **button_options,
         )
         diff_4 = ttk.Radiobutton(
             self.diff_frame,
             text='4',
             value=self.DIFF_EXPERT,
             variable=self.difficulty,
-            style='FFMS.Toolbutton',
-            takefocus=False,
-            cursor='hand2',
+            **button_options,
         )
 
         diff_label.grid(
@@ -1402,43 +1308,34 @@ class FreeFormMinesweeper:
         diff_4.grid(row=1, column=3, sticky=tk.NSEW)
         self.diff_frame.grid(row=0, column=4)
 
-        self.controls_frame.grid_columnconfigure(0, weight=1)
-        self.controls_frame.grid_columnconfigure(1, weight=1)
+        self.controls_frame.grid_columnconfigure((0, 1), weight=1)
         fill_button = ttk.Button(
             self.controls_frame,
             text='Fill',
             width=6,
-            style='FFMS.Toolbutton',
             command=self.fill_board,
-            takefocus=False,
-            cursor='hand2',
+            **button_options,
         )
         clear_button = ttk.Button(
             self.controls_frame,
             text='Clear',
             width=6,
-            style='FFMS.Toolbutton',
             command=self.clear_board,
-            takefocus=False,
-            cursor='hand2',
+            **button_options,
         )
         invert_board_button = ttk.Button(
             self.controls_frame,
             text='Invert',
             width=6,
-            style='FFMS.Toolbutton',
             command=self.invert_board,
-            takefocus=False,
-            cursor='hand2',
+            **button_options,
         )
         center_board_button = ttk.Button(
             self.controls_frame,
             text='Center',
             width=6,
-            style='FFMS.Toolbutton',
             command=self.center_board,
-            takefocus=False,
-            cursor='hand2',
+            **button_options,
         )
 
         fill_button.grid(row=0, column=1, sticky=tk.NSEW)
@@ -1449,93 +1346,146 @@ class FreeFormMinesweeper:
 
         self.menu_frame.grid(row=0, column=0, sticky=tk.NSEW)
 
+        self.menu_buttons = [
+            widget
+            for widget in chain(
+                self.presets_frame.grid_slaves(),
+                self.mswpr_frame.grid_slaves(),
+                (
+                    widget
+                    for widget in self.diff_frame.grid_slaves()
+                    if not isinstance(widget, ttk.Label)
+                ),
+                self.controls_frame.grid_slaves(),
+            )
+            if isinstance(widget, ttk.Widget)
+        ]
+        special_buttons = (self.new_game_button, self.mode_switch_button)
+        self.regular_menu_buttons = [
+            button for button in self.menu_buttons if button not in special_buttons
+        ]
+
     def init_board(self) -> None:
-        """Set up the squares on the board."""
+        """Set up the squares on the board.
 
+        The board is built one row at a time from idle callbacks, so the window
+        stays responsive while large boards are created. The UI is guarded until
+        the board is complete.
+        """
+        self.set_guard()
+        self.board_squares = []
+        self.board_builder = self.build_board()
+        self.game_root.after_idle(self.build_board_step)
+
+    def build_board(self) -> Iterator[None]:
+        """Create the squares on the board, yielding after each row."""
+        unlocked_image = self.board_images['unlocked']
+        columns = range(self.columns.get())
         for x in range(self.rows.get()):
-            for y in range(self.columns.get()):
-                # self.game_root.update_idletasks()
-                self.make_square(x, y)
-
-    def make_square(self, row: int, column: int) -> None:
-        """Make a BoardSquare and place it in the grid"""
-        self.game_root.update_idletasks()
-        sq = BoardSquare(
-            self.board_frame,
-            self.ih.lookup(
-                self.board_square_size,
-                self.theme,
-                self.ih.ImageCategory.BOARD,
-                'unlocked',
-            ),
-            'FFMS.TLabel',
-        )
-        sq.bind('<Button-1>', self.left_mouse_press_handler)
-        sq.bind('<Button-3>', self.right_mouse_press_handler)
-        sq.bind('<B1-Motion>', self.mouse_motion_handler)
-        sq.bind('<ButtonRelease-1>', self.mouse_release_handler)
-        sq.bind('<Double-Button-1>', self.double_mouse_handler)
+            self.board_squares.append(
+                [self.make_square(x, y, unlocked_image) for y in columns]
+            )
+            yield
+
+    def build_board_step(self) -> None:
+        """Build the next row of the board, and finish up once it is complete."""
+        try:
+            next(self.board_builder)
+        except StopIteration:
+            self.index_squares()
+            self.game_root.update_idletasks()
+            self.unset_guard()
+        else:
+            self.game_root.after_idle(self.build_board_step)
+
+    def index_squares(self) -> None:
+        """Rebuild the flat, row-major list of squares from the board grid."""
+        self.squares = list(chain.from_iterable(self.board_squares))
+
+    @contextmanager
+    def batched_updates(self) -> Iterator[None]:
+        """Flush pending layout and redraw work once, after a bulk board change."""
+        try:
+            yield
+        finally:
+            self.game_root.update_idletasks()
+
+    def make_square(
+        self, row: int, column: int, unlocked_image: tk.PhotoImage
+    ) -> BoardSquare:
+        """Make a BoardSquare and place it in the grid
+
+        Squares removed from the board by shrinking it are kept in a pool,
+        and are reused here before any new squares are created.
+        Callers are responsible for flushing idle tasks once they are done
+        placing squares.
+        """
+        if self.square_pool:
+            sq = self.square_pool.pop()
+            sq.reset()
+            sq.image = unlocked_image
+        else:
+            sq = BoardSquare(self.board_frame, unlocked_image, 'FFMS.TLabel')
+            sq.bindtags((self.BOARD_SQUARE_TAG, *sq.bindtags()))
         sq.grid(row=row, column=column)
+        return sq
 
     # UI Interaction Methods
 
     def quit_game(self, ask: bool = True) -> None:
         a = tk.BooleanVar()
         if ask:
-            YesNoDialogue(
-                self.game_root,
-                question='Are you sure you want to quit?',
-                answer=a,
-            )
+            with self.paused_timer():
+                YesNoDialogue(
+                    self.game_root,
+                    question='Are you sure you want to quit?',
+                    answer=a,
+                )
         else:
             a.set(True)
         if a.get():
             self.game_root.withdraw()
             self._hidden_root.destroy()
-            self.alive = False
 
     def lock_toolbar(self) -> None:
         """Configure toolbar for options designed for sweeping mode."""
         self.menubar.entryconfigure('File', state=tk.DISABLED)
         self.menubar.entryconfigure('Edit', state=tk.DISABLED)
         self.menubar.entryconfigure('Options', state=tk.DISABLED)
-        game_submenu: tk.Menu = self.game_root.nametowidget(
-            self.menubar.entrycget('Game', 'menu')
-        )
-        game_submenu.entryconfigure('Play Game', state=tk.DISABLED)
-        game_submenu.entryconfigure('Stop Playing', state=tk.NORMAL)
-        game_submenu.entryconfigure('New Game', state=tk.NORMAL)
+        self.game_menu.entryconfigure('Play Game', state=tk.DISABLED)
+        self.game_menu.entryconfigure('Stop Playing', state=tk.NORMAL)
+        self.game_menu.entryconfigure('New Game', state=tk.NORMAL)
         if self.click_mode.get() != self.ClickMode.FLAGLESS:
-            game_submenu.entryconfigure('Flagging Mode', state=tk.NORMAL)
+            self.game_menu.entryconfigure('Flagging Mode', state=tk.NORMAL)
 
     def unlock_toolbar(self) -> None:
         """Configure toolbar for options designed for drawing mode."""
         self.menubar.entryconfigure('File', state=tk.NORMAL)
         self.menubar.entryconfigure('Edit', state=tk.NORMAL)
         self.menubar.entryconfigure('Options', state=tk.NORMAL)
-        game_submenu: tk.Menu = self.game_root.nametowidget(
-            self.menubar.entrycget('Game', 'menu')
-        )
-        game_submenu.entryconfigure('Play Game', state=tk.NORMAL)
-        game_submenu.entryconfigure('Stop Playing', state=tk.DISABLED)
-        game_submenu.entryconfigure('New Game', state=tk.DISABLED)
-        game_submenu.entryconfigure('Flagging Mode', state=tk.DISABLED)
+        self.game_menu.entryconfigure('Play Game', state=tk.NORMAL)
+        self.game_menu.entryconfigure('Stop Playing', state=tk.DISABLED)
+        self.game_menu.entryconfigure('New Game', state=tk.DISABLED)
+        self.game_menu.entryconfigure('Flagging Mode', state=tk.DISABLED)
 
     def set_guard(self) -> None:
         """Disable the UI while important events occur."""
+        if self.guarded:
+            return
+        self.guarded = True
         self.game_root.title('FreeForm Minesweeper (Loading...)')
         self.state = self.State.PAUSE
         self.lock_toolbar()
-        for button in self.get_menu_buttons:
-            assert isinstance(button, ttk.Widget)
+        for button in self.menu_buttons:
             button.state(['disabled'])
 
     def unset_guard(self) -> None:
         """Enable the UI."""
-        for button in self.get_menu_buttons:
-            assert isinstance(button, ttk.Widget)
-            if button not in (self.new_game_button, self.mode_switch_button):
-                button.state(['!disabled'])
+        if not self.guarded:
+            return
+        self.guarded = False
+        for button in self.regular_menu_buttons:
+            button.state(['!disabled'])
         self.unlock_toolbar()
         self.state = self.State.DRAW
         self.game_root.title('FreeForm Minesweeper')
@@ -1544,75 +1494,56 @@ class FreeFormMinesweeper:
         """Hide/show parts of the UI depending on the board size."""
         if not self.adaptive_ui.get():
             return
-        thresholds_lb_lu = (22, 17, 13, 9)
-        thresholds_lb_su = (14, 11, 8, 5)
-        thresholds_sb_lu = (43, 34, 26, 17)
-        thresholds_sb_su = (27, 21, 16, 9)
-        bs = self.board_scale.get()
-        us = self.ui_scale.get()
-        if bs == self.LARGE_SCALE and us == self.LARGE_SCALE:
-            thresholds = thresholds_lb_lu
-        elif bs == self.LARGE_SCALE and us == self.SMALL_SCALE:
-            thresholds = thresholds_lb_su
-        elif bs == self.SMALL_SCALE and us == self.LARGE_SCALE:
-            thresholds = thresholds_sb_lu
-        elif bs == self.SMALL_SCALE and us == self.SMALL_SCALE:
-            thresholds = thresholds_sb_su
+        thresholds = self.UI_THRESHOLDS[(self.board_scale.get(), self.ui_scale.get())]
+        classic = self.classic_ui.get()
 
         curr_columns = self.columns.get()
-        if curr_columns < thresholds[0]:
-            self.controls_frame.grid_remove()
-            self.menu_frame.grid_columnconfigure(5, weight=0)
-        elif not self.classic_ui.get():
-            self.controls_frame.grid()
-            self.menu_frame.grid_columnconfigure(5, weight=1)
+        for section, threshold in zip(
+            (
+                self.controls_frame,
+                self.diff_frame,
+                self.presets_frame,
+                self.leaderboard_button,
+            ),
+            thresholds,
+        ):
+            if curr_columns < threshold:
+                self.set_section_visible(section, False)
+            elif not classic:
+                self.set_section_visible(section, True)
 
-        if curr_columns < thresholds[1]:
-            self.diff_frame.grid_remove()
-            self.menu_frame.grid_columnconfigure(4, weight=0)
-        elif not self.classic_ui.get():
-            self.diff_frame.grid()
-            self.menu_frame.grid_columnconfigure(4, weight=1)
+    def set_section_visible(self, section: ttk.Widget, visible: bool) -> None:
+        """Show or hide a collapsible section of the menu.
 
-        if curr_columns < thresholds[2]:
-            self.presets_frame.grid_remove()
-            self.menu_frame.grid_columnconfigure(0, weight=0)
-        elif not self.classic_ui.get():
-            self.presets_frame.grid()
-            self.menu_frame.grid_columnconfigure(0, weight=1)
+        Nothing is done if the section is already in the requested state.
 
-        if curr_columns < thresholds[3]:
-            self.leaderboard_button.grid_remove()
-            self.new_game_button.grid_configure(padx=0)
-        elif not self.classic_ui.get():
-            self.leaderboard_button.grid()
-            self.new_game_button.grid_configure(padx=self.UI_PADDING)
+        Args:
+            section: One of the presets, difficulty or controls frames,
+                or the leaderboard button.
+            visible: Whether the section should be shown.
+        """
+        if self.section_visibility.get(section, True) is visible:
+            return
+        self.section_visibility[section] = visible
+        if visible:
+            section.grid()
+        else:
+            section.grid_remove()
+        if section is self.leaderboard_button:
+            self.new_game_button.grid_configure(padx=self.UI_PADDING if visible else 0)
+        else:
+            self.menu_frame.grid_columnconfigure(
+                self.section_columns[section], weight=int(visible)
+            )
 
     def sweep_click_hold_handler(self, square: BoardSquare) -> None:
         if not square.enabled or not square.covered:
                 return
-        self.new_game_button.config(
-            image=self.ih.lookup(
-                self.ui_square_size,
-                self.theme,
-                self.ih.ImageCategory.UI,
-                'shocked',
-            )
-        )
+        self.set_ui_button_image(self.new_game_button, 'shocked')
         if self.currently_held_square is not None:
-            self.currently_held_square.image = self.ih.lookup(
-                self.board_square_size,
-                self.theme,
-                self.ih.ImageCategory.BOARD,
-                'covered',
-            )
+            self.currently_held_square.image = self.board_images['covered']
         self.currently_held_square = square
-        square.image = self.ih.lookup(
-            self.board_square_size,
-            self.theme,
-            self.ih.ImageCategory.BOARD,
-            '0',
-        )
+        square.image = self.board_images['0']
 
     def left_mouse_press_handler(self, event: tk.Event) -> None:
         """Handle mouse press events in the board.
@@ -1621,9 +1552,11 @@ class FreeFormMinesweeper:
             event: Tkinter event.
         """
         square: BoardSquare = event.widget
+        self.drag_square = square
+        self.motion_square = square
         if self.state is self.State.DRAW:
             self.square_toggle_enabled(square)
-            self.draw_history_step.append(square)
+            self.draw_history_step.add(square)
         elif self.state is self.State.SWEEP:
             self.sweep_click_hold_handler(square)
 
@@ -1635,69 +1568,77 @@ class FreeFormMinesweeper:
         """
         square: BoardSquare = event.widget
         if self.state is self.State.SWEEP:
-            if self.click_mode.get() == self.ClickMode.UNCOVER:
+            click_mode = self.click_mode.get()
+            if click_mode == self.ClickMode.UNCOVER:
                 if not self.multimine.get():
                     if square.flag_count:
                         self.remove_flag(square)
                     else:
                         self.add_flag(square)
-            elif self.click_mode.get() == self.ClickMode.FLAG:
+            elif click_mode == self.ClickMode.FLAG:
                 self.remove_flag(square)
 
+    def new_game_press_handler(self, event: tk.Event) -> None:
+        """Show the held face while the new game button is pressed.
+
+        Args:
+            event: Tkinter event.
+        """
+        if self.state is not self.State.DRAW:
+            self.set_ui_button_image(self.new_game_button, 'held')
+
+    def new_game_release_handler(self, event: tk.Event) -> None:
+        """Start a new game when the new game button is released.
+
+        Args:
+            event: Tkinter event.
+        """
+        self.new_game()
+
+    def board_origin_handler(self, event: tk.Event) -> None:
+        """Cache the screen position of the board when the window or board moves.
+
+        Args:
+            event: Tkinter event.
+        """
+        if event.widget is self.game_root or event.widget is self.board_frame:
+            self.board_origin = (
+                self.board_frame.winfo_rootx(),
+                self.board_frame.winfo_rooty(),
+            )
+
     def mouse_release_handler(self, event: tk.Event) -> None:
         """Handle mouse release events in the board.
 
         Args:
             event: Tkinter event.
         """
+        self.motion_square = None
         if self.state is self.State.DRAW:
             self.inc_history()
         elif self.state is self.State.SWEEP:
             square = self.currently_held_square
             if square is None:
                 return
-            x = (
-                event.x_root - square.master.winfo_rootx()
-            ) // self.board_square_size_px
-            y = (
-                event.y_root - square.master.winfo_rooty()
-            ) // self.board_square_size_px
+            board_x, board_y = self.board_origin
+            square_size_px = self.board_square_size_px
+            x = (event.x_root - board_x) // square_size_px
+            y = (event.y_root - board_y) // square_size_px
             square = None
-            if y in range(self.rows.get()) and x in range(self.columns.get()):
-                square = self.board_frame.grid_slaves(row=y, column=x)[0]
+            if 0 <= y < len(self.board_squares) and 0 <= x < len(self.board_squares[y]):
+                square = self.board_squares[y][x]
 
             if square is None or not square.enabled or not square.covered:
-                self.new_game_button.config(
-                    image=self.ih.lookup(
-                        self.ui_square_size,
-                        self.theme,
-                        self.ih.ImageCategory.UI,
-                        'new',
-                    )
-                )
+                self.set_ui_button_image(self.new_game_button, 'new')
                 if self.currently_held_square is not None:
-                    self.currently_held_square.image = self.ih.lookup(
-                        self.ui_square_size,
-                        self.theme,
-                        self.ih.ImageCategory.BOARD,
-                        'covered',
-                    )
+                    self.currently_held_square.image = self.board_images['covered']
                     self.currently_held_square = None
                 return
 
             self.currently_held_square = None
-            self.new_game_button.config(
-                image=self.ih.lookup(
-                    self.ui_square_size,
-                    self.theme,
-                    self.ih.ImageCategory.UI,
-                    'new',
-                )
-            )
-            if self.click_mode.get() in (
-                self.ClickMode.UNCOVER,
-                self.ClickMode.FLAGLESS,
-            ):
+            self.set_ui_button_image(self.new_game_button, 'new')
+            click_mode = self.click_mode.get()
+            if click_mode in self.UNCOVER_MODES:
                 if not square.enabled or square.flag_count:
                     return
                 self.uncover_square(square)
@@ -1707,7 +1648,7 @@ class FreeFormMinesweeper:
                     self.chord(square)
                 if self.squares_cleared == self.squares_to_win:
                     self.game_won()
-            elif self.click_mode.get() == self.ClickMode.FLAG:
+            elif click_mode == self.ClickMode.FLAG:
                 self.add_flag(square)
 
     def double_mouse_handler(self, event: tk.Event) -> None:
@@ -1719,13 +1660,15 @@ class FreeFormMinesweeper:
         square: BoardSquare = event.widget
         if self.state is self.State.DRAW:
             self.square_toggle_enabled(square)
-            self.draw_history_step.append(square)
+            self.draw_history_step.add(square)
         elif self.state is not self.State.PAUSE and not square.covered:
+            value = square.value
             flags_around = 0
-            for neighbour in square.neighbours.values():
-                if neighbour:
-                    flags_around += neighbour.flag_count
-            if flags_around == square.value:
+            for neighbour in square.neighbours:
+                flags_around += neighbour.flag_count
+                if flags_around > value:
+                    break
+            if flags_around == value:
                 self.chord(square, force=True)
             if self.squares_cleared == self.squares_to_win:
                 self.game_won()
@@ -1741,50 +1684,65 @@ class FreeFormMinesweeper:
         Args:
             event: Tkinter event.
         """
-        initial_square: BoardSquare = event.widget
-        x = (
-                event.x_root - initial_square.master.winfo_rootx()
-        ) // self.board_square_size_px
-        y = (
-            event.y_root - initial_square.master.winfo_rooty()
-        ) // self.board_square_size_px
-        square = None
-        if y in range(self.rows.get()) and x in range(self.columns.get()):
-            square = self.board_frame.grid_slaves(row=y, column=x)[0]
-
-        if not isinstance(square, BoardSquare):
+        board_x, board_y = self.board_origin
+        square_size_px = self.board_square_size_px
+        x = (event.x_root - board_x) // square_size_px
+        y = (event.y_root - board_y) // square_size_px
+        board_squares = self.board_squares
+        if not (0 <= y < len(board_squares) and 0 <= x < len(board_squares[y])):
             return
+        square = board_squares[y][x]
+        # Motion within the square last handled has nothing new to do
+        if square is self.motion_square:
+            return
+        self.motion_square = square
 
         if self.state is self.State.DRAW:
-            if square.enabled != initial_square.enabled:
+            drag_square = self.drag_square
+            if drag_square is not None and square.enabled != drag_square.enabled:
                 self.square_toggle_enabled(square)
-                self.draw_history_step.append(square)
+                self.draw_history_step.add(square)
         elif self.state is self.State.SWEEP:
             if self.currently_held_square is not None:
                 self.sweep_click_hold_handler(square)
 
     def inc_history(self) -> None:
-        """Add the current history step to the history."""
-        self.draw_history.append(self.draw_history_step.copy())
-        if (
-            self.draw_history_buffer
-            and self.draw_history_step == self.draw_history_buffer[-1]
-        ):
-            self.draw_history_buffer.pop(-1)
+        """Add the current history step to the history.
+
+        Steps are stored as sorted flat board indices, keeping them small
+        and directly comparable.
+        """
+        columns = self.columns.get()
+        positions = (square.position for square in self.draw_history_step)
+        step = array('I', sorted(row * columns + column for row, column in positions))
+        self.draw_history.append(step)
+        if self.draw_history_buffer and step == self.draw_history_buffer[-1]:
+            self.draw_history_buffer.pop()
         else:
             self.draw_history_buffer.clear()
         self.draw_history_step.clear()
 
+    def toggle_history_step(self, step: array[int]) -> None:
+        """Toggle every square recorded in a history step.
+
+        Args:
+            step: Flat board indices of the squares to toggle.
+        """
+        columns = self.columns.get()
+        board_squares = self.board_squares
+        for index in step:
+            row, column = divmod(index, columns)
+            self.square_toggle_enabled(board_squares[row][column])
+
     def undo_history(self) -> None:
         """Move to the previous point in history."""
         if self.state is not self.State.DRAW:
             return
         if not self.draw_history:
             return
-        step = self.draw_history.pop(-1)
+        step = self.draw_history.pop()
         self.draw_history_buffer.append(step)
-        for square in step:
-            self.square_toggle_enabled(square)
+        self.toggle_history_step(step)
 
     def redo_history(self) -> None:
         """Move to the next point in the history buffer."""
@@ -1792,10 +1750,9 @@ class FreeFormMinesweeper:
             return
         if not self.draw_history_buffer:
             return
-        step = self.draw_history_buffer.pop(-1)
+        step = self.draw_history_buffer.pop()
         self.draw_history.append(step)
-        for square in step:
-            self.square_toggle_enabled(square)
+        self.toggle_history_step(step)
 
     def clear_history(self) -> None:
         """Clear all the drawing history data."""
@@ -1809,32 +1766,32 @@ class FreeFormMinesweeper:
         Returns:
             A list of bit strings representing a game board.
         """
-        leftmost = self.columns.get() - 1
+        # Each row is packed into an int, with the leftmost square as the top bit
+        columns = self.columns.get()
+        row_masks: list[int] = []
+        first_row = last_row = -1
+        widest = 0
+        for row, board_row in enumerate(self.board_squares):
+            row_mask = 0
+            for square in board_row:
+                row_mask = row_mask << 1 | square.enabled
+            row_masks.append(row_mask)
+            if row_mask:
+                if first_row < 0:
+                    first_row = row
+                last_row = row
+                widest = max(widest, row_mask.bit_length())
+        if first_row < 0:
+            return []
+        leftmost = columns - widest
         board_bits: list[str] = []
-        reached_content = False
-        for row in range(self.rows.get()):
-            bit_row = ''
-            for col in range(self.columns.get()):
-                square = self.board_frame.grid_slaves(row=row, column=col)[0]
-                assert isinstance(square, BoardSquare)
-                bit_row += '1' if square.enabled else '0'
-            if '1' in bit_row:
-                leftmost_index = bit_row.index('1')
-                rightmost_index = bit_row.rindex('1') + 1
-                leftmost = min(leftmost_index, leftmost)
-                reached_content = True
-                board_bits.append(bit_row[:rightmost_index])
-            elif '1' not in bit_row and reached_content:
+        for row_mask in row_masks[first_row : last_row + 1]:
+            if row_mask:
+                # The lowest set bit marks the rightmost enabled square
+                rightmost = columns + 1 - (row_mask & -row_mask).bit_length()
+                board_bits.append(f'{row_mask:0{columns}b}'[leftmost:rightmost])
+            else:
                 board_bits.append('0')
-        last_content_index = len(board_bits)
-        for i, bit_row in enumerate(reversed(board_bits)):
-            if '1' in bit_row:
-                last_content_index -= i
-                break
-        board_bits = board_bits[:last_content_index]
-        for i, bit_row in enumerate(board_bits):
-            if bit_row != '0':
-                board_bits[i] = bit_row[leftmost:]
         return board_bits
 
     def compress_board_rle(self) -> str:
@@ -1843,83 +1800,144 @@ class FreeFormMinesweeper:
         Returns:
             Run length encoded string representing a game board.
         """
-        board_bits = self.compress_board()
-        board_txt = 'N'.join(board_bits).replace('1', 'E').replace('0', 'D')
-        board_rle = ''.join(str(len(list(g))) + k for k, g in groupby(board_txt))
-        return board_rle
-
-    @cached_property
-    def get_menu_buttons(self) -> list[tk.Widget]:
-        """Get all the buttons present in the menu."""
-        return list(
-            chain(
-                self.presets_frame.grid_slaves(),
-                self.mswpr_frame.grid_slaves(),
-                (
-                    widget
-                    for widget in self.diff_frame.grid_slaves()
-                    if not isinstance(widget, ttk.Label)
-                ),
-                self.controls_frame.grid_slaves(),
-            )
-        )
+        # Maps a bit to the bit ending its run, and the run's symbol
+        run_symbols = {'0': ('1', 'D'), '1': ('0', 'E')}
+        runs: list[str] = []
+        for bit_row in self.compress_board():
+            if runs:
+                runs.append('1N')
+            row_length = len(bit_row)
+            start = 0
+            while start < row_length:
+                other_bit, symbol = run_symbols[bit_row[start]]
+                end = bit_row.find(other_bit, start)
+                if end == -1:
+                    end = row_length
+                runs.append(f'{end - start}{symbol}')
+                start = end
+        return ''.join(runs)
+
+    def set_sevseg_display(self, labels: tuple[ttk.Label, ...], value: int) -> None:
+        """Show a number on a seven segment display, updating only changed digits.
+
+        Args:
+            labels: The hundreds, tens, and ones digit labels of the display.
+            value: Number to show. Only the last three digits are displayed.
+        """
+        hundreds, remainder = divmod(value % 1000, 100)
+        for label, digit in zip(labels, (hundreds, *divmod(remainder, 10))):
+            image = self.sevseg_images[digit]
+            if self.sevseg_label_images.get(label) is image:
+                continue
+            label.config(image=image)
+            self.sevseg_label_images[label] = image
 
     def update_timer(self) -> None:
         """Update timer widgets."""
-        seconds = list(str(int(self.time_elapsed)).zfill(3))
-        for number in self.timer_frame.grid_slaves():
-            assert isinstance(number, ttk.Label)
-            number.config(
-                image=self.ih.lookup(
-                    self.sevseg_size,
-                    self.theme,
-                    self.ih.ImageCategory.SEVSEG,
-                    seconds.pop(),
-                )
-            )
+        self.set_sevseg_display(self.timer_labels, int(self.time_elapsed))
 
     def reset_timer(self) -> None:
         """Reset timer widgets."""
-        for number in self.timer_frame.grid_slaves():
-            assert isinstance(number, ttk.Label)
-            number.config(
-                image=self.ih.lookup(
-                    self.sevseg_size,
-                    self.theme,
-                    self.ih.ImageCategory.SEVSEG,
-                    '0',
-                ),
-            )
+        self.set_sevseg_display(self.timer_labels, 0)
 
     def update_flag_counter(self) -> None:
         """Update flag widgets."""
-        flags = list(str(self.num_mines - self.flags_placed).zfill(3))
-        for number in self.flags_frame.grid_slaves():
-            assert isinstance(number, ttk.Label)
-            number.config(
-                image=self.ih.lookup(
-                    self.sevseg_size,
-                    self.theme,
-                    self.ih.ImageCategory.SEVSEG,
-                    flags.pop(),
-                )
-            )
+        self.set_sevseg_display(self.flag_labels, self.num_mines - self.flags_placed)
+
+    def schedule_flag_counter_update(self) -> None:
+        """Update flag widgets once the event loop is idle.
+
+        Repeated flag changes before then are merged into a single update.
+        """
+        if self.flag_counter_update_pending:
+            return
+        self.flag_counter_update_pending = True
+        self.game_root.after_idle(self.flush_flag_counter_update)
+
+    def flush_flag_counter_update(self) -> None:
+        """Apply a scheduled flag widget update, unless the game has ended."""
+        self.flag_counter_update_pending = False
+        if self.state is self.State.SWEEP:
+            self.update_flag_counter()
 
     def reset_flag_counter(self) -> None:
         """Reset flag widgets."""
-        for number in self.flags_frame.grid_slaves():
-            assert isinstance(number, ttk.Label)
-            number.config(
-                image=self.ih.lookup(
-                    self.sevseg_size,
-                    self.theme,
-                    self.ih.ImageCategory.SEVSEG,
-                    '0',
-                ),
+        self.set_sevseg_display(self.flag_labels, 0)
+
+    def update_board_images(self) -> None:
+        """Fetch the board square images for the current board scale and theme."""
+        self.board_images = {
+            name: self.ih.lookup(
+                self.board_square_size,
+                self.theme,
+                self.ih.ImageCategory.BOARD,
+                name,
+            )
+            for name in self.BOARD_IMAGE_NAMES
+        }
+        self.number_images = tuple(
+            self.board_images[str(value)] for value in range(self.MAX_SQUARE_VALUE + 1)
+        )
+        board_images = self.board_images
+        self.flag_images = {
+            count: board_images[f'flag_{count}'] for count in self.MINE_COUNTS
+        }
+        self.wrong_flag_images = {
+            count: board_images[f'flag_{count}_wrong'] for count in self.MINE_COUNTS
+        }
+        self.mine_images = {
+            count: board_images[f'mine_{count}'] for count in self.MINE_COUNTS
+        }
+        self.exploded_mine_images = {
+            count: board_images[f'mine_{count}_explode'] for count in self.MINE_COUNTS
+        }
+
+    def update_sevseg_images(self) -> None:
+        """Fetch the seven segment digit images for the current UI scale and theme."""
+        self.sevseg_images = tuple(
+            self.ih.lookup(
+                self.sevseg_size,
+                self.theme,
+                self.ih.ImageCategory.SEVSEG,
+                str(digit),
+            )
+            for digit in range(10)
+        )
+
+    def update_ui_images(self) -> None:
+        """Fetch the UI button images for the current UI scale and theme."""
+        self.ui_images = {
+            name: self.ih.lookup(
+                self.ui_square_size,
+                self.theme,
+                self.ih.ImageCategory.UI,
+                name,
             )
+            for name in self.UI_IMAGE_NAMES
+        }
+
+    def set_ui_button_image(self, button: ttk.Widget, name: str) -> None:
+        """Set the image of a UI button, skipping the update if already shown.
+
+        Args:
+            button: Button to update.
+            name: Name of the UI image to display.
+        """
+        image = self.ui_images[name]
+        if self.ui_button_images.get(button) is image:
+            return
+        button.config(image=image)
+        self.ui_button_images[button] = image
 
     # Gameplay methods
 
+    def redraw_board(self) -> None:
+        """Redraw every square with the current board size and theme."""
+        covered_image = self.board_images['covered']
+        unlocked_image = self.board_images['unlocked']
+        for square in self.squares:
+            square.image = covered_image if square.enabled else unlocked_image
+
     def square_toggle_enabled(self, square: BoardSquare) -> None:
         """Toggle a square's enabled status and update its image.
 
@@ -1928,19 +1946,9 @@ class FreeFormMinesweeper:
         """
         square.toggle_enable()
         if square.enabled:
-            square.image = self.ih.lookup(
-                self.board_square_size,
-                self.theme,
-                self.ih.ImageCategory.BOARD,
-                'covered',
-            )
+            square.image = self.board_images['covered']
         else:
-            square.image = self.ih.lookup(
-                self.board_square_size,
-                self.theme,
-                self.ih.ImageCategory.BOARD,
-                'unlocked',
-            )
+            square.image = self.board_images['unlocked']
 
     def uncover_square(self, square: BoardSquare) -> None:
         """Uncover a square and update its image.
@@ -1948,29 +1956,24 @@ class FreeFormMinesweeper:
         Args:
             square: Square to uncover.
         """
-        if square.mine_count and not square.flag_count:
-            if self.grace_rule.get() and self.squares_cleared == 0:
+        if (
+            square.mine_count
+            and not square.flag_count
+            and self.squares_cleared == 0
+            and self.grace_rule.get()
+        ):
+            # Deal new boards until the first square uncovered is safe
+            while square.mine_count:
                 self.new_game()
-                self.uncover_square(square)
-                return
-            square.image = self.ih.lookup(
-                self.board_square_size,
-                self.theme,
-                self.ih.ImageCategory.BOARD,
-                f'mine_{square.mine_count}_explode',
-            )
+        if square.mine_count and not square.flag_count:
+            square.image = self.exploded_mine_images[square.mine_count]
             square.uncover()
             self.game_lost()
         elif square.covered and not square.flag_count:
-            square.calculate_value()
             square.uncover()
-            square.image = self.ih.lookup(
-                self.board_square_size,
-                self.theme,
-                self.ih.ImageCategory.BOARD,
-                str(square.value),
-            )
+            square.image = self.number_images[square.value]
             self.squares_cleared += 1
+            self.start_timer()
 
     def chord(self, square: BoardSquare, force: bool = False) -> None:
         """Chord a square.
@@ -1981,49 +1984,68 @@ class FreeFormMinesweeper:
                 This only applied to the clicked square, not any neighbours.
                 Defaults to False.
         """
-        chord_q = {square}
+        columns = self.columns.get()
+        visited = bytearray(self.rows.get() * columns)
+        row, column = square.position
+        visited[row * columns + column] = True
+        number_images = self.number_images
+        squares_cleared = 0
+        # Image updates for the flood are applied together once it is resolved
+        pending_images: list[tuple[BoardSquare, tk.PhotoImage]] = []
+        chord_q = deque((square,))
         while chord_q:
-            curr_square = chord_q.pop()
-            self.uncover_square(curr_square)
-            if curr_square.value == 0 or force:
+            curr_square = chord_q.popleft()
+            if (
+                curr_square.covered
+                and not curr_square.mine_count
+                and not curr_square.flag_count
+            ):
+                # Inlined safe path of uncover_square, the bulk of any flood
+                curr_square.uncover()
+                pending_images.append((curr_square, number_images[curr_square.value]))
+                squares_cleared += 1
+            else:
+                self.uncover_square(curr_square)
+            if (curr_square.value == 0 and not curr_square.covered) or force:
                 force = False
-                for n_sq in curr_square.neighbours.values():
-                    if n_sq and n_sq.covered:
-                        chord_q.add(n_sq)
+                for n_sq in curr_square.neighbours:
+                    if n_sq.covered:
+                        row, column = n_sq.position
+                        index = row * columns + column
+                        if not visited[index]:
+                            visited[index] = True
+                            chord_q.append(n_sq)
+        self.squares_cleared += squares_cleared
+        self.start_timer()
+        for curr_square, image in pending_images:
+            curr_square.image = image
 
     def link_squares_neighbours(self, square: BoardSquare) -> None:
-        """Link a square to its eight potential neighbours.
+        """Link a square to its enabled neighbours.
 
         Args:
             square: The square being given neighbours.
         """
-        dirs = square.directions
+        board_squares = self.board_squares
+        rows = len(board_squares)
+        columns = len(board_squares[0])
         square_row, square_col = square.position
-        k = 0
-        for i in range(-1, 2):
-            for j in range(-1, 2):
-                if i == j == 0:
-                    continue
-                curr_direction = dirs[k]
-                k += 1
-                check_x = i + square_row
-                check_y = j + square_col
-                if check_x in range(self.rows.get()) and check_y in range(
-                    self.columns.get()
-                ):
-                    child_widget = self.board_frame.grid_slaves(
-                        row=check_x, column=check_y
-                    )[0]
-                    if isinstance(child_widget, BoardSquare) and child_widget.enabled:
-                        square.neighbours[curr_direction] = child_widget
-                    else:
-                        square.neighbours[curr_direction] = None
+        neighbours = square.neighbours
+        neighbours.clear()
+        for i, j in self.NEIGHBOUR_OFFSETS:
+            check_x = i + square_row
+            check_y = j + square_col
+            if 0 <= check_x < rows and 0 <= check_y < columns:
+                neighbour = board_squares[check_x][check_y]
+                if neighbour.enabled:
+                    neighbours.append(neighbour)
 
     def toggle_click_mode(self, event: tk.Event | None = None) -> None:
         """Toggle the clicking mode of the game."""
         if self.state is self.State.DRAW:
             return
-        if self.click_mode.get() == self.ClickMode.FLAGLESS:
+        click_mode = self.click_mode.get()
+        if click_mode == self.ClickMode.FLAGLESS:
             return
         if event is not None:
             if event.type is tk.EventType.KeyPress:
@@ -2032,42 +2054,28 @@ class FreeFormMinesweeper:
                 self.mode_key_down = True
             elif event.type is tk.EventType.KeyRelease:
                 self.mode_key_down = False
-        if self.click_mode.get() == self.ClickMode.UNCOVER:
+        if click_mode == self.ClickMode.UNCOVER:
             self.click_mode.set(self.ClickMode.FLAG)
-        elif self.click_mode.get() == self.ClickMode.FLAG:
+        elif click_mode == self.ClickMode.FLAG:
             self.click_mode.set(self.ClickMode.UNCOVER)
 
     def fill_board(self) -> None:
         """Make all squares enabled."""
         if self.state is not self.State.DRAW:
             return
-        for square in self.board_frame.grid_slaves():
-            assert isinstance(square, BoardSquare)
-            if not square.enabled:
-                self.square_toggle_enabled(square)
-                self.draw_history_step.append(square)
-        self.inc_history()
+        self.apply_board_state(repeat(True))
 
     def clear_board(self) -> None:
         """Make all squares disabled."""
         if self.state is not self.State.DRAW:
             return
-        for square in self.board_frame.grid_slaves():
-            assert isinstance(square, BoardSquare)
-            if square.enabled:
-                self.square_toggle_enabled(square)
-                self.draw_history_step.append(square)
-        self.inc_history()
+        self.apply_board_state(repeat(False))
 
     def invert_board(self) -> None:
         """Toggle all the squares on the board between enabled and disabled."""
         if self.state is not self.State.DRAW:
             return
-        for square in self.board_frame.grid_slaves():
-            assert isinstance(square, BoardSquare)
-            self.square_toggle_enabled(square)
-            self.draw_history_step.append(square)
-        self.inc_history()
+        self.apply_board_state([not square.enabled for square in self.squares])
 
     def center_board(self) -> None:
         if self.state is not self.State.DRAW:
@@ -2076,23 +2084,38 @@ class FreeFormMinesweeper:
         board_bits = self.compress_board()
         if not board_bits:
             return
-        longest_row_len = len(max(board_bits, key=len))
-        padded_right_bits = [row.ljust(longest_row_len, '0') for row in board_bits]
+        longest_row_len = max(map(len, board_bits))
         columns = self.columns.get()
-        centered_board_bits = [row.center(columns, '0') for row in padded_right_bits]
-        rows = self.rows.get()
-        num_empty_rows = rows - len(centered_board_bits)
+        centered_board_bits = [
+            row.ljust(longest_row_len, '0').center(columns, '0') for row in board_bits
+        ]
+        num_empty_rows = self.rows.get() - len(centered_board_bits)
         num_rows_before = num_empty_rows // 2
-        num_rows_after = num_empty_rows - num_rows_before
-        for _ in range(num_rows_before):
-            centered_board_bits.insert(0, '0' * columns)
-        for _ in range(num_rows_after):
-            centered_board_bits.append('0' * columns)
-        bit_string = ''.join(centered_board_bits)
-        for square, bit in zip(self.board_frame.grid_slaves(), reversed(bit_string)):
-            if isinstance(square, BoardSquare) and square.enabled != bool(int(bit)):
-                self.square_toggle_enabled(square)
-                self.draw_history_step.append(square)
+        empty_row = '0' * columns
+        bit_string = ''.join(
+            chain(
+                repeat(empty_row, num_rows_before),
+                centered_board_bits,
+                repeat(empty_row, num_empty_rows - num_rows_before),
+            )
+        )
+        self.apply_board_state(bit == '1' for bit in bit_string)
+
+    def apply_board_state(self, states: Iterable[bool]) -> None:
+        """Enable or disable every square, only updating squares that change.
+
+        The changed squares are recorded as a single step in the history.
+
+        Args:
+            states: Whether each square should be enabled, in row-major order.
+        """
+        covered_image = self.board_images['covered']
+        unlocked_image = self.board_images['unlocked']
+        for square, enabled in zip(self.squares, states):
+            if square.enabled != enabled:
+                square.toggle_enable()
+                square.image = covered_image if enabled else unlocked_image
+                self.draw_history_step.add(square)
         self.inc_history()
 
     def load_board(
@@ -2117,7 +2140,7 @@ class FreeFormMinesweeper:
             with open(board_file, 'r') as board_load_file:
                 board_bits = [
                     line.strip()
-                    for line in board_load_file.readlines()
+                    for line in board_load_file.read().splitlines()
                     if not line.startswith('#')
                 ]
         except Exception:
@@ -2126,24 +2149,17 @@ class FreeFormMinesweeper:
                 'Was not able to open the file.',
             )
             return
-        if (
-            len(board_bits) > self.rows.get()
-            or len(max(board_bits, key=len)) > self.columns.get()
-        ):
+        rows = self.rows.get()
+        columns = self.columns.get()
+        if len(board_bits) > rows or max(map(len, board_bits), default=0) > columns:
             AcknowledgementDialogue(
                 self.game_root,
                 'Board was too large to be loaded properly',
             )
             return
-        self.clear_board()
-        for curr_row, bit_row in enumerate(board_bits):
-            for curr_col, bit in enumerate(bit_row):
-                if bit == '1':
-                    square = self.board_frame.grid_slaves(
-                        row=curr_row, column=curr_col
-                    )[0]
-                    assert isinstance(square, BoardSquare)
-                    self.square_toggle_enabled(square)
+        padded_bits = chain(board_bits, repeat('', rows - len(board_bits)))
+        bit_string = ''.join(bit_row.ljust(columns, '0') for bit_row in padded_bits)
+        self.apply_board_state(bit == '1' for bit in bit_string)
         self.clear_history()
         if difficulty:
             self.difficulty.set(difficulty)
@@ -2178,7 +2194,7 @@ class FreeFormMinesweeper:
             )
 
     def place_mines(self, enabled_squares: list[BoardSquare]) -> None:
-        """Place mines in the board.
+        """Place mines in the board, then number the safe squares.
 
         Args:
             enabled_squares: Enabled squares.
@@ -2218,17 +2234,17 @@ class FreeFormMinesweeper:
             )
         else:
             squares_with_mines = sample(enabled_squares, k=self.num_mines)
-        self.squares_to_win = num_enabled_squares - len(squares_with_mines)
-
-        for square in squares_with_mines:
-            square.add_mine()
-            mines_to_place -= 1
+        batch_size = len(squares_with_mines)
+        self.squares_to_win = num_enabled_squares - batch_size
 
+        # Layer the mine counts first, so each square is only touched once
+        mine_counts = [1] * batch_size
+        mines_to_place -= batch_size
         while mines_to_place > 0:
-            batch_size = ceil(len(squares_with_mines) * multimine_proportion)
-            squares_with_mines = squares_with_mines[:batch_size]
-            for square in squares_with_mines:
-                if square.mine_count >= 5:
+            batch_size = ceil(batch_size * multimine_proportion)
+            layer_size = min(batch_size, mines_to_place)
+            if layer_size:
+                if mine_counts[0] >= self.MAX_SQUARE_MINES:
                     AcknowledgementDialogue(
                         self.game_root,
                         (
@@ -2240,10 +2256,17 @@ class FreeFormMinesweeper:
                     )
                     self.stop_game()
                     raise RuntimeError('Mine placement went wrong.')
-                square.add_mine()
-                mines_to_place -= 1
-                if mines_to_place == 0:
-                    break
+                mine_counts[:layer_size] = [
+                    count + 1 for count in mine_counts[:layer_size]
+                ]
+            mines_to_place -= layer_size
+
+        for square, count in zip(squares_with_mines, mine_counts):
+            square.add_mine(count)
+        # Numbers are fixed once mines are placed, so uncovering only reads them
+        for square in enabled_squares:
+            if not square.mine_count:
+                square.calculate_value()
 
     def add_flag(self, square: BoardSquare) -> None:
         """Add a flag to a square.
@@ -2255,14 +2278,10 @@ class FreeFormMinesweeper:
             return
         if square.flag_count < self.max_flags and self.flags_placed < self.num_mines:
             square.add_flag()
-            square.image = self.ih.lookup(
-                self.board_square_size,
-                self.theme,
-                self.ih.ImageCategory.BOARD,
-                f'flag_{square.flag_count}',
-            )
+            square.image = self.flag_images[square.flag_count]
             self.flags_placed += 1
-            self.update_flag_counter()
+            self.schedule_flag_counter_update()
+            self.start_timer()
 
     def remove_flag(self, square: BoardSquare) -> None:
         """Remove a flag from a square.
@@ -2275,31 +2294,18 @@ class FreeFormMinesweeper:
         if square.flag_count > 0:
             square.remove_flag()
             if square.flag_count == 0:
-                square.image = self.ih.lookup(
-                    self.board_square_size,
-                    self.theme,
-                    self.ih.ImageCategory.BOARD,
-                    'covered',
-                )
+                square.image = self.board_images['covered']
             else:
-                square.image = self.ih.lookup(
-                    self.board_square_size,
-                    self.theme,
-                    self.ih.ImageCategory.BOARD,
-                    f'flag_{square.flag_count}',
-                )
+                square.image = self.flag_images[square.flag_count]
             self.flags_placed -= 1
-            self.update_flag_counter()
+            self.schedule_flag_counter_update()
+            if not self.flags_placed and not self.squares_cleared:
+                self.stop_timer()
 
     def start_game(self) -> None:
         """Exit drawing state and enter sweeping state."""
         self.state = self.State.PAUSE
-        squares = self.board_frame.grid_slaves()
-        enabled_squares: list[BoardSquare] = []
-        for square in squares:
-            assert isinstance(square, BoardSquare)
-            if square.enabled:
-                enabled_squares.append(square)
+        enabled_squares = [square for square in self.squares if square.enabled]
         if len(enabled_squares) < 9:
             AcknowledgementDialogue(
                 self.game_root,
@@ -2308,31 +2314,22 @@ class FreeFormMinesweeper:
             self.stop_game()
             return
 
-        for button in self.get_menu_buttons:
-            assert isinstance(button, ttk.Widget)
-            if button is self.new_game_button:
-                button.state(['!disabled'])
-            elif (
-                button is self.mode_switch_button
-                and self.click_mode.get() != self.ClickMode.FLAGLESS
-            ):
-                button.state(['!disabled'])
-            else:
-                button.state(['disabled'])
+        for button in self.regular_menu_buttons:
+            button.state(['disabled'])
+        self.new_game_button.state(['!disabled'])
+        if self.click_mode.get() == self.ClickMode.FLAGLESS:
+            self.mode_switch_button.state(['disabled'])
+        else:
+            self.mode_switch_button.state(['!disabled'])
         self.lock_toolbar()
         self.play_button.grid_remove()
         if not self.classic_ui.get():
             self.stop_button.grid()
         self.clear_history()
-        for square in squares:
-            assert isinstance(square, BoardSquare)
+        locked_image = self.board_images['locked']
+        for square in self.squares:
             if not square.enabled:
-                square.image = self.ih.lookup(
-                    self.board_square_size,
-                    self.theme,
-                    self.ih.ImageCategory.BOARD,
-                    'locked',
-                )
+                square.image = locked_image
             else:
                 self.link_squares_neighbours(square)
         self.place_mines(enabled_squares)
@@ -2345,35 +2342,25 @@ class FreeFormMinesweeper:
         if self.state is self.State.DRAW:
             return
         self.state = self.State.PAUSE
-        self.new_game_button.config(
-            image=self.ih.lookup(
-                self.ui_square_size,
-                self.theme,
-                self.ih.ImageCategory.UI,
-                'new',
-            )
-        )
+        self.stop_timer()
+        self.set_ui_button_image(self.new_game_button, 'new')
+        covered_image = self.board_images['covered']
         enabled_squares: list[BoardSquare] = []
-        for square in self.board_frame.grid_slaves():
-            assert isinstance(square, BoardSquare)
+        for square in self.squares:
             if square.enabled:
                 enabled_squares.append(square)
                 square.reset()
                 square.toggle_enable()
-                square.image = self.ih.lookup(
-                    self.board_square_size,
-                    self.theme,
-                    self.ih.ImageCategory.BOARD,
-                    'covered',
-                )
+                square.image = covered_image
         self.place_mines(enabled_squares)
         self.squares_cleared = 0
         self.flags_placed = 0
         self.time_elapsed = 0.0
         self.reset_timer()
-        if self.click_mode.get() != self.ClickMode.FLAGLESS:
+        click_mode = self.click_mode.get()
+        if click_mode != self.ClickMode.FLAGLESS:
             self.update_flag_counter()
-        if self.click_mode.get() == self.ClickMode.FLAG:
+        if click_mode == self.ClickMode.FLAG:
             self.toggle_click_mode()
         self.state = self.State.SWEEP
 
@@ -2381,56 +2368,40 @@ class FreeFormMinesweeper:
         """Exit sweeping state and enter drawing state."""
         if self.state is not self.State.PAUSE and self.squares_cleared:
             a = tk.BooleanVar()
-            YesNoDialogue(
-                self.game_root,
-                question='Are you sure you want to stop playing?',
-                answer=a,
-            )
+            with self.paused_timer():
+                YesNoDialogue(
+                    self.game_root,
+                    question='Are you sure you want to stop playing?',
+                    answer=a,
+                )
             if not a.get():
                 return
         self.state = self.State.PAUSE
-        for button in self.get_menu_buttons:
-            assert isinstance(button, ttk.Widget)
-            if button in (self.new_game_button, self.mode_switch_button):
-                button.state(['disabled'])
-            else:
-                button.state(['!disabled'])
+        self.stop_timer()
+        for button in self.regular_menu_buttons:
+            button.state(['!disabled'])
+        self.new_game_button.state(['disabled'])
+        self.mode_switch_button.state(['disabled'])
         self.unlock_toolbar()
         self.stop_button.grid_remove()
         if not self.classic_ui.get():
             self.play_button.grid()
-        for square in self.board_frame.grid_slaves():
-            assert isinstance(square, BoardSquare)
+        covered_image = self.board_images['covered']
+        unlocked_image = self.board_images['unlocked']
+        for square in self.squares:
             if not square.enabled:
-                square.image = self.ih.lookup(
-                    self.board_square_size,
-                    self.theme,
-                    self.ih.ImageCategory.BOARD,
-                    'unlocked',
-                )
+                square.image = unlocked_image
             else:
                 square.reset()
                 square.toggle_enable()
-                square.image = self.ih.lookup(
-                    self.board_square_size,
-                    self.theme,
-                    self.ih.ImageCategory.BOARD,
-                    'covered',
-                )
+                square.image = covered_image
         self.squares_cleared = 0
         self.flags_placed = 0
         self.squares_to_win = 0
         self.time_elapsed = 0.0
         self.reset_timer()
         self.reset_flag_counter()
-        self.new_game_button.config(
-            image=self.ih.lookup(
-                self.ui_square_size,
-                self.theme,
-                self.ih.ImageCategory.UI,
-                'new',
-            )
-        )
+        self.set_ui_button_image(self.new_game_button, 'new')
         if self.click_mode.get() == self.ClickMode.FLAG:
             self.toggle_click_mode()
         self.state = self.State.DRAW
@@ -2438,23 +2409,11 @@ class FreeFormMinesweeper:
     def game_won(self) -> None:
         """Game over sequence."""
         self.state = self.State.PAUSE
-        self.new_game_button.config(
-            image=self.ih.lookup(
-                self.ui_square_size,
-                self.theme,
-                self.ih.ImageCategory.UI,
-                'win',
-            )
-        )
-        for square in self.board_frame.grid_slaves():
-            assert isinstance(square, BoardSquare)
+        self.stop_timer()
+        self.set_ui_button_image(self.new_game_button, 'win')
+        for square in self.squares:
             if square.enabled and square.covered and not square.flag_count:
-                square.image = self.ih.lookup(
-                    self.board_square_size,
-                    self.theme,
-                    self.ih.ImageCategory.BOARD,
-                    f'flag_{square.mine_count}',
-                )
+                square.image = self.flag_images[square.mine_count]
         self.reset_flag_counter()
         if not self.prompt_leaderboard_save.get():
             return
@@ -2475,53 +2434,66 @@ class FreeFormMinesweeper:
     def game_lost(self) -> None:
         """Game win sequence."""
         self.state = self.State.PAUSE
-        self.new_game_button.config(
-            image=self.ih.lookup(
-                self.ui_square_size,
-                self.theme,
-                self.ih.ImageCategory.UI,
-                'lose',
-            )
-        )
-        for square in self.board_frame.grid_slaves():
-            assert isinstance(square, BoardSquare)
+        self.stop_timer()
+        self.set_ui_button_image(self.new_game_button, 'lose')
+        for square in self.squares:
             if square.mine_count and not square.flag_count and square.covered:
-                square.image = self.ih.lookup(
-                    self.board_square_size,
-                    self.theme,
-                    self.ih.ImageCategory.BOARD,
-                    f'mine_{square.mine_count}',
-                )
+                square.image = self.mine_images[square.mine_count]
             elif square.flag_count and square.flag_count != square.mine_count:
-                square.image = self.ih.lookup(
-                    self.board_square_size,
-                    self.theme,
-                    self.ih.ImageCategory.BOARD,
-                    f'flag_{square.flag_count}_wrong',
-                )
+                square.image = self.wrong_flag_images[square.flag_count]
+
+    def start_timer(self) -> None:
+        """Start or resume the game timer, once something has been done this game."""
+        if (
+            self.timer_start is not None
+            or self.state is not self.State.SWEEP
+            or not (self.squares_cleared or self.flags_placed)
+        ):
+            return
+        # Resume from the time already on the clock, ticking on its next second
+        self.timer_start = monotonic() - self.time_elapsed
+        self.timer_job = self.game_root.after(
+            1000 - int(self.time_elapsed * 1000) % 1000, self.timer_tick
+        )
+
+    def stop_timer(self) -> None:
+        """Stop the game timer, keeping the time elapsed so far."""
+        if self.timer_start is None:
+            return
+        self.time_elapsed = min(monotonic() - self.timer_start, 999.0)
+        self.timer_start = None
+        if self.timer_job is not None:
+            self.game_root.after_cancel(self.timer_job)
+            self.timer_job = None
+
+    @contextmanager
+    def paused_timer(self) -> Iterator[None]:
+        """Hold the game timer while a modal dialogue is open."""
+        self.stop_timer()
+        try:
+            yield
+        finally:
+            self.start_timer()
+
+    def timer_tick(self) -> None:
+        """Update the game timer, and schedule the next tick on a second boundary."""
+        self.timer_job = None
+        if self.timer_start is None:
+            return
+        elapsed = monotonic() - self.timer_start
+        self.time_elapsed = min(elapsed, 999.0)
+        self.update_timer()
+        if elapsed < 999.0:
+            self.timer_job = self.game_root.after(
+                1000 - int(elapsed * 1000) % 1000, self.timer_tick
+            )
 
     def mainloop(self) -> None:
         """Run the mainloop to play the game."""
-        while self.alive:
-            try:
-                self.game_root.update_idletasks()
-                self.game_root.update()
-            except tk.TclError:
-                return
-            else:
-                sleep(self.MAINLOOP_TIME)
-                if self.state is self.State.SWEEP and (
-                    self.squares_cleared or self.flags_placed
-                ):
-                    self.time_elapsed = min(
-                        round(self.time_elapsed + self.MAINLOOP_TIME, 2),
-                        999.0,
-                    )
-                    if self.time_elapsed.is_integer():
-                        try:
-                            self.update_timer()
-                        except tk.TclError:
-                            break
+        try:
+            self._hidden_root.mainloop()
+        except tk.TclError:
+            return
 
 
 if __name__ == '__main__':
@@ -2,7 +2,7 @@
 
 from enum import Enum
 from pathlib import Path
-from tkinter import PhotoImage
+from tkinter import PhotoImage, TclError
 
 
 class ImageHandler:
@@ -34,7 +34,15 @@ class ImageHandler:
         Ideally ImageHandler should only be instantiated once.
         Can only be instantiated after the Tkinter root window is created.
         """
-        self.__image_cache: dict[Path, PhotoImage] = {}
+        self.__image_cache: dict[
+            tuple[
+                ImageHandler.ImageSize,
+                ImageHandler.ImageTheme,
+                ImageHandler.ImageCategory,
+                str,
+            ],
+            PhotoImage,
+        ] = {}
 
     def lookup(
         self,
@@ -52,18 +60,23 @@ class ImageHandler:
             name: Name of the image.
 
         Raises:
-            ValueError: The image could not be fetched with given parameters.
+            ValueError: The image does not exist, or could not be loaded.
 
         Returns:
             The PhotoImage instance of the image fetched.
         """
+        key = (size, theme, category, name)
+        if key in self.__image_cache:
+            return self.__image_cache[key]
         image_path = (
             Path('assets') / category.value / theme.value / size.value / f'{name}.png'
         )
-        if not image_path.exists():
-            raise ValueError(f'No such image exists: {image_path}')
-        if image_path in self.__image_cache:
-            return self.__image_cache[image_path]
-        photoimage = PhotoImage(file=str(image_path.resolve()))
-        self.__image_cache[image_path] = photoimage
+        # Tk reports a missing or unreadable file itself, saving a separate check
+        try:
+            photoimage = PhotoImage(file=str(image_path.resolve()))
+        except TclError as error:
+            if not image_path.exists():
+                raise ValueError(f'No such image exists: {image_path}') from error
+            raise ValueError(f'Could not load image: {image_path}') from error
+        self.__image_cache[key] = photoimage
         return photoimage